@@ -4,7 +4,7 @@ Pydantic models for request/response validation
 Enhanced with confidence scoring and multilingual entity extraction
 """
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List, Dict, Any, Literal
 from datetime import datetime
 from enum import Enum
@@ -44,12 +44,6 @@ class UrgencyInfo(BaseModel):
     reasoning: str = Field(..., description="Explanation for urgency classification")
     confidence: float = Field(1.0, ge=0.0, le=1.0, description="AI confidence score 0-1")
 
-    @validator('level')
-    def validate_level(cls, v):
-        if not 1 <= v <= 5:
-            raise ValueError('Urgency level must be between 1 and 5')
-        return v
-
 
 class ExtractedEntities(BaseModel):
     """Entities extracted from voicemail across any language"""
@@ -109,14 +103,16 @@ class VoicemailInput(BaseModel):
     audio_file_url: Optional[str] = Field(None, description="URL to audio file")
     audio_quality_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="Audio clarity score")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "transcript": "Hi, this is John Smith calling about my blood pressure medication...",
                 "caller_phone": "+61412345678",
                 "duration_seconds": 45
             }
         }
+    )
 
 
 class TriagedVoicemail(BaseModel):
@@ -192,8 +188,9 @@ class TriagedVoicemail(BaseModel):
     pms_appointment_id: Optional[str] = Field(None, description="Created appointment ID if any")
     pms_last_sync: Optional[datetime] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra="ignore",
+        json_schema_extra={
             "example": {
                 "voicemail_id": "vm_20240115_001",
                 "language": "Vietnamese",
@@ -223,6 +220,7 @@ class TriagedVoicemail(BaseModel):
                 "is_pii_safe": True
             }
         }
+    )
 
 
 class BatchTriageRequest(BaseModel):
@@ -248,6 +246,9 @@ class VoicemailListResponse(BaseModel):
 
 class AnalyticsSummary(BaseModel):
     """Analytics dashboard data"""
+    # Built from the analytics counters and never modified afterwards
+    model_config = ConfigDict(frozen=True)
+
     total_voicemails: int
     pending_count: int
     processed_today: int
@@ -261,6 +262,8 @@ class AnalyticsSummary(BaseModel):
 
 class HealthCheckResponse(BaseModel):
     """Health check response"""
+    model_config = ConfigDict(frozen=True)
+
     status: str
     service: str
     timestamp: str
@@ -3,15 +3,121 @@ Heidi Calls: Analytics API Router
 Dashboard metrics and reporting endpoints
 """
 
+import time
 from fastapi import APIRouter
-from collections import Counter
-from datetime import datetime, timedelta
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 
 from app.models.schemas import AnalyticsSummary
 from app.routers.voicemail import voicemail_store
+from app.services.voicemail_store import StoreListener, VoicemailRow
+from app.services.voicemail_columns import VoicemailColumns
+from app.utils.responses import json_response, raw_json_response
+from app.utils import clock
+from app.utils.clock import DAY_US, HOUR_US, MISSING_TIMESTAMP, epoch_us
 
 router = APIRouter()
 
+# Handlers here are `async def` with no awaits, so they run on the event
+# loop like store writes do. No write (and no listener update behind it)
+# can land mid-read, so the aggregator counters and timeline columns are
+# always read in one consistent state. Each read is O(1) or one cheap sweep.
+
+# Number of past hours covered by the urgency timeline (plus the current hour)
+TIMELINE_HOURS = 24
+# date.toordinal() of 1970-01-01, to turn dates into epoch day numbers
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+# Urgency levels are 1-5; index 0 is unused
+_LEVEL_SLOTS = 6
+
+# Bucket name for urgency level n is _LEVEL_NAMES[n - 1]
+_LEVEL_NAMES = ("low", "moderate", "standard", "high", "critical")
+# Levels in the order buckets appear in responses (most urgent first)
+_LEVELS_DESC = range(len(_LEVEL_NAMES), 0, -1)
+
+# Statuses counted as pending work in staff metrics
+_PENDING_STATUSES = frozenset({"pending", "processed"})
+
+# Dashboards poll /summary; reuse the last result while the store is
+# unchanged, for at most this long (keeps processed_today fresh)
+SUMMARY_CACHE_TTL_SECONDS = 1.0
+
+
+def _bump(counter: Counter, key, delta: int) -> None:
+    """Adjust a counter entry, dropping keys that fall to zero"""
+    value = counter[key] + delta
+    if value:
+        counter[key] = value
+    else:
+        del counter[key]
+
+
+class AnalyticsAggregator(StoreListener):
+    """
+    Incrementally maintained dashboard counters
+
+    Each voicemail's last row is remembered so that re-indexing after an
+    in-place update subtracts the old values before adding the new ones.
+    Reading the summary is then O(1) in the store size.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.pending_count = 0
+        self.urgency_counts: Counter = Counter()
+        self.intent_counts: Counter = Counter()
+        self.language_counts: Counter = Counter()
+        # Keyed by UTC day number since the epoch
+        self.processed_by_day: Counter = Counter()
+        # assigned_to -> [total, actioned, pending]
+        self.staff_counts: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
+        self.assigned_total = 0
+        self._rows: Dict[str, VoicemailRow] = {}
+
+    def _apply(self, row: VoicemailRow, delta: int) -> None:
+        self.total += delta
+        if row.status == "pending":
+            self.pending_count += delta
+        _bump(self.urgency_counts, row.urgency_level, delta)
+        _bump(self.intent_counts, row.intent, delta)
+        _bump(self.language_counts, row.language, delta)
+        if row.processed_us != MISSING_TIMESTAMP:
+            _bump(self.processed_by_day, row.processed_us // DAY_US, delta)
+        if row.assigned_to:
+            self.assigned_total += delta
+            counts = self.staff_counts[row.assigned_to]
+            counts[0] += delta
+            if row.status == "actioned":
+                counts[1] += delta
+            elif row.status in _PENDING_STATUSES:
+                counts[2] += delta
+            if not counts[0]:
+                del self.staff_counts[row.assigned_to]
+
+    def on_upsert(self, row: VoicemailRow) -> None:
+        previous = self._rows.pop(row.voicemail_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+        self._rows[row.voicemail_id] = row
+        self._apply(row, 1)
+
+    def on_remove(self, row: VoicemailRow) -> None:
+        previous = self._rows.pop(row.voicemail_id, None)
+        if previous is not None:
+            self._apply(previous, -1)
+
+
+analytics_aggregator = AnalyticsAggregator()
+voicemail_store.subscribe(analytics_aggregator)
+
+# Column copy of the same fields for full scans (timeline bucketing)
+voicemail_columns = VoicemailColumns()
+voicemail_store.subscribe(voicemail_columns)
+
+# (store version, monotonic time computed, summary rendered as JSON)
+_summary_cache: Optional[Tuple[int, float, bytes]] = None
+
 
 @router.get("/summary", response_model=AnalyticsSummary)
 async def get_analytics_summary():
@@ -20,9 +126,25 @@ async def get_analytics_summary():
     
     Returns aggregate metrics for the voicemail dashboard.
     """
-    voicemails = list(voicemail_store.values())
+    global _summary_cache
+    
+    version = voicemail_store.version
+    now = time.monotonic()
+    if _summary_cache is not None:
+        cached_version, cached_at, cached_body = _summary_cache
+        if cached_version == version and now - cached_at < SUMMARY_CACHE_TTL_SECONDS:
+            return raw_json_response(cached_body)
+    
+    body = _build_analytics_summary().model_dump_json().encode()
+    _summary_cache = (version, now, body)
+    return raw_json_response(body)
+
+
+def _build_analytics_summary() -> AnalyticsSummary:
+    """Build the summary from the incrementally maintained counters"""
+    aggregator = analytics_aggregator
     
-    if not voicemails:
+    if not aggregator.total:
         return AnalyticsSummary(
             total_voicemails=0,
             pending_count=0,
@@ -33,40 +155,28 @@ async def get_analytics_summary():
             language_distribution={}
         )
     
-    # Count pending
-    pending_count = sum(1 for v in voicemails if v.status == "pending")
-    
     # Processed today
-    today = datetime.utcnow().date()
-    processed_today = sum(
-        1 for v in voicemails 
-        if v.processed_at and v.processed_at.date() == today
-    )
+    today = clock.today().toordinal() - _EPOCH_ORDINAL
+    processed_today = aggregator.processed_by_day.get(today, 0)
     
     # Urgency distribution
-    urgency_counts = Counter(v.urgency.level for v in voicemails)
+    urgency_counts = aggregator.urgency_counts
     urgency_distribution = {
-        "critical": urgency_counts.get(5, 0),
-        "high": urgency_counts.get(4, 0),
-        "standard": urgency_counts.get(3, 0),
-        "moderate": urgency_counts.get(2, 0),
-        "low": urgency_counts.get(1, 0)
+        _LEVEL_NAMES[level - 1]: urgency_counts.get(level, 0) for level in _LEVELS_DESC
     }
     
     # Intent distribution
-    intent_counts = Counter(v.intent.value for v in voicemails)
-    intent_distribution = dict(intent_counts)
+    intent_distribution = dict(aggregator.intent_counts)
     
     # Language distribution
-    language_counts = Counter(v.language for v in voicemails)
-    language_distribution = dict(language_counts)
+    language_distribution = dict(aggregator.language_counts)
     
     # Average processing time (mock for demo)
     avg_processing_time_ms = 450.0  # Simulated average
     
     return AnalyticsSummary(
-        total_voicemails=len(voicemails),
-        pending_count=pending_count,
+        total_voicemails=aggregator.total,
+        pending_count=aggregator.pending_count,
         processed_today=processed_today,
         urgency_distribution=urgency_distribution,
         intent_distribution=intent_distribution,
@@ -82,32 +192,31 @@ async def get_urgency_timeline():
     
     Returns hourly breakdown of voicemail urgency levels.
     """
-    voicemails = list(voicemail_store.values())
-    
     # Group by hour for the last 24 hours
     now = datetime.utcnow()
-    timeline = []
+    now_us = epoch_us(now)
+    
+    # One pass over the created/urgency columns. Bucket h covers
+    # [now - h hours, now - h hours + 1 hour), i.e. h = ceil(age / 1 hour);
+    # counts is a flat (hour, level) matrix with _LEVEL_SLOTS per row.
+    counts = [0] * ((TIMELINE_HOURS + 1) * _LEVEL_SLOTS)
+    for created_us, level in zip(voicemail_columns.created_us, voicemail_columns.urgency):
+        hours_ago = -((created_us - now_us) // HOUR_US)
+        if 0 <= hours_ago <= TIMELINE_HOURS:
+            counts[hours_ago * _LEVEL_SLOTS + level] += 1
     
-    for hours_ago in range(24, -1, -1):
+    timeline = []
+    for hours_ago in range(TIMELINE_HOURS, -1, -1):
         hour_start = now - timedelta(hours=hours_ago)
-        hour_end = hour_start + timedelta(hours=1)
-        
-        hour_voicemails = [
-            v for v in voicemails
-            if v.created_at and hour_start <= v.created_at < hour_end
-        ]
+        row = hours_ago * _LEVEL_SLOTS
         
-        timeline.append({
-            "hour": hour_start.strftime("%H:%M"),
-            "critical": sum(1 for v in hour_voicemails if v.urgency.level == 5),
-            "high": sum(1 for v in hour_voicemails if v.urgency.level == 4),
-            "standard": sum(1 for v in hour_voicemails if v.urgency.level == 3),
-            "moderate": sum(1 for v in hour_voicemails if v.urgency.level == 2),
-            "low": sum(1 for v in hour_voicemails if v.urgency.level == 1),
-            "total": len(hour_voicemails)
-        })
+        entry = {"hour": hour_start.strftime("%H:%M")}
+        for level in _LEVELS_DESC:
+            entry[_LEVEL_NAMES[level - 1]] = counts[row + level]
+        entry["total"] = sum(counts[row:row + _LEVEL_SLOTS])
+        timeline.append(entry)
     
-    return {"timeline": timeline}
+    return json_response({"timeline": timeline})
 
 
 @router.get("/staff-metrics")
@@ -115,29 +224,18 @@ async def get_staff_metrics():
     """
     Get staff workload and performance metrics
     """
-    voicemails = list(voicemail_store.values())
+    aggregator = analytics_aggregator
     
     # Group by assigned staff
     staff_metrics = {}
-    unassigned_count = 0
-    
-    for vm in voicemails:
-        if vm.assigned_to:
-            if vm.assigned_to not in staff_metrics:
-                staff_metrics[vm.assigned_to] = {
-                    "total": 0,
-                    "actioned": 0,
-                    "pending": 0
-                }
-            staff_metrics[vm.assigned_to]["total"] += 1
-            if vm.status == "actioned":
-                staff_metrics[vm.assigned_to]["actioned"] += 1
-            elif vm.status in ["pending", "processed"]:
-                staff_metrics[vm.assigned_to]["pending"] += 1
-        else:
-            unassigned_count += 1
-    
-    return {
+    for assigned_to, (total, actioned, pending) in aggregator.staff_counts.items():
+        staff_metrics[assigned_to] = {
+            "total": total,
+            "actioned": actioned,
+            "pending": pending
+        }
+    
+    return json_response({
         "staff_metrics": staff_metrics,
-        "unassigned_count": unassigned_count
-    }
+        "unassigned_count": aggregator.total - aggregator.assigned_total
+    })
@@ -4,9 +4,14 @@ RESTful endpoints for voicemail management
 Enhanced with confidence scoring and entity extraction
 """
 
-from fastapi import APIRouter, HTTPException, Query, BackgroundTasks
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+import heapq
+import json
 import uuid
 
 from app.models.schemas import (
@@ -15,358 +20,89 @@ from app.models.schemas import (
     BatchTriageRequest,
     BatchTriageResponse,
     VoicemailListResponse,
-    UpdateVoicemailRequest,
-    UrgencyInfo,
-    IntentType,
-    LanguageInfo,
-    ExtractedEntities,
-    UIState,
-    EscalationInfo,
-    LocationInfo,
-    PatientMatchInfo
+    UpdateVoicemailRequest
 )
 from app.services.triage_service import triage_service
 from app.services.emergency_escalation import emergency_escalation, EMERGENCY_SCRIPT_BILINGUAL
 from app.services.smart_routing import smart_routing
+from app.services.voicemail_store import AgedStatusIndex, SortedRowIndex, TextScanIndex, VoicemailRow, VoicemailStore
+from app.utils.responses import json_response, model_response
+from app.utils.clock import HOUR_US, MISSING_TIMESTAMP, now_us
 
 router = APIRouter()
 
 # In-memory storage for demo (replace with database in production)
-voicemail_store: dict[str, TriagedVoicemail] = {}
+voicemail_store = VoicemailStore()
+
+# Handlers here run on the event loop and never await between reading the
+# store and writing it back, so each read-modify-write is atomic with
+# respect to other requests and scans never see a half-applied update.
+# Keep it that way: anything awaited (e.g. triage) happens before the
+# store is touched. Analytics handlers run on the loop too, for the same
+# reason.
 
 # Auto-hide actioned items after this many hours (archived items are kept)
 ACTIONED_HIDE_HOURS = 48
+old_actioned = AgedStatusIndex("actioned", ACTIONED_HIDE_HOURS * HOUR_US)
+voicemail_store.subscribe(old_actioned)
+
+# Transcript substring search for the symptom and medication filters
+transcript_search = TextScanIndex("transcript_text")
+voicemail_store.subscribe(transcript_search)
+
+# Callback statuses that still need a call back
+_CALLBACK_PENDING_STATUSES = frozenset({"pending", "attempted", "no_answer"})
+# Callback statuses that record a completed call
+_CALLBACK_COMPLETED_STATUSES = frozenset({"successful", "no_answer", "left_message", "wrong_number"})
+
+# Voicemails awaiting a callback, most urgent first, then oldest
+pending_callbacks = SortedRowIndex(
+    include=lambda r: r.callback_status in _CALLBACK_PENDING_STATUSES and r.status != "archived",
+    key=lambda r: (-r.urgency_level, r.created_us)
+)
+voicemail_store.subscribe(pending_callbacks)
 
+# Voicemails from one batch request triaged at the same time (LLM calls)
+BATCH_TRIAGE_CONCURRENCY = 8
 
-def _get_recent_time(hours_ago: float = 0, minutes_ago: float = 0) -> datetime:
-    """Generate a recent timestamp relative to now"""
-    return datetime.utcnow() - timedelta(hours=hours_ago, minutes=minutes_ago)
-
-
-def _seed_demo_data():
-    """Seed demo data with enhanced entity extraction and confidence scores"""
-    demo_voicemails = [
-        {
-            "voicemail_id": "vm_20240115_demo001",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=5, reasoning="Patient reporting severe chest pain and shortness of breath", confidence=0.95),
-            "intent": IntentType.EMERGENCY,
-            "summary": "Patient experiencing chest pain and difficulty breathing for the past hour",
-            "action_item": "IMMEDIATE: Contact patient and advise to call 000 or present to ED immediately",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345789",
-                callback_number_raw="●●●●●●●789",
-                urgency_keywords=["chest pain", "trouble breathing", "urgently"],
-                symptoms=["chest pain", "shortness of breath"],
-                medicare_number="2345678901",
-                medicare_number_masked="XXXX XXXX X01",
-                mentioned_doctor=None,
-                mentioned_location=None
-            ),
-            "location_info": LocationInfo(
-                assigned_location="harbour",
-                location_confidence=0.75,
-                routing_reason="patient_history",
-                available_locations=["harbour", "sunset", "central", "northside"]
-            ),
-            "patient_match": PatientMatchInfo(
-                medicare_matched=True,
-                patient_id="PAT-678901",
-                match_confidence=0.95,
-                previous_location="harbour"
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=True),
-            "escalation": EscalationInfo(
-                escalation_triggered=True,
-                emergency_alert_sent=True,
-                intervention_status="Voice_Alert_Sent",
-                timestamp_escalated=_get_recent_time(minutes_ago=25).isoformat() + "Z",
-                emergency_script=EMERGENCY_SCRIPT_BILINGUAL,
-                sms_sent_to="+61400000001",
-                actions_taken=["SMS_Alert_Sent_To_Manager", "Voice_Alert_Sent_To_Patient"]
-            ),
-                        "is_pii_safe": True,
-            "redacted_transcript": "Hi, this is [NAME REDACTED] calling. I've been having really bad chest pain for the past hour and I'm having trouble breathing. My Medicare is [MEDICARE REDACTED]. Please call me back urgently at ●●●●●●●789.",
-            "caller_phone_redacted": "●●●●●●●789",
-            "caller_phone_hash": "hash_0412345789",
-            "call_count_today": 2,
-            "is_repeat_caller": True,
-            "related_voicemail_ids": ["vm_20240115_demo001b"],
-            "callback_status": "pending",
-            "pms_linked": True,
-            "pms_system": "best_practice",
-            "pms_patient_id": "BP-001",
-            "created_at": _get_recent_time(minutes_ago=25),
-            "processed_at": _get_recent_time(minutes_ago=24),
-            "status": "processed"
-        },
-        # Duplicate call from same patient (earlier call)
-        {
-            "voicemail_id": "vm_20240115_demo001b",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=3, reasoning="Patient reporting mild chest discomfort", confidence=0.75),
-            "intent": IntentType.BOOKING,
-            "summary": "Patient requesting appointment for chest discomfort - earlier call before symptoms worsened",
-            "action_item": "Schedule appointment with GP",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345789",
-                callback_number_raw="●●●●●●●789",
-                urgency_keywords=["chest", "discomfort"],
-                symptoms=["mild chest discomfort"],
-                medicare_number="2345678901",
-                medicare_number_masked="XXXX XXXX X01",
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "Hi, this is [NAME REDACTED]. I've been having some mild chest discomfort. Could I book an appointment to see the doctor? My number is ●●●●●●●789.",
-            "caller_phone_redacted": "●●●●●●●789",
-            "caller_phone_hash": "hash_0412345789",
-            "call_count_today": 2,
-            "is_repeat_caller": True,
-            "related_voicemail_ids": ["vm_20240115_demo001"],
-            "callback_status": "pending",
-            "created_at": _get_recent_time(hours_ago=1, minutes_ago=30),
-            "processed_at": _get_recent_time(hours_ago=1, minutes_ago=29),
-            "status": "processed"
-        },
-        {
-            "voicemail_id": "vm_20240115_demo002",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=4, reasoning="Patient without critical cardiac medication for 2 days", confidence=0.88),
-            "intent": IntentType.PRESCRIPTION,
-            "summary": "Patient needs urgent refill of blood pressure medication - has been without for 2 days",
-            "action_item": "Flag for Dr. Wong at Sunset clinic for prescriber review TODAY - arrange e-script for antihypertensive",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345456",
-                callback_number_raw="●●●●●●●456",
-                urgency_keywords=["run out", "two days", "blood pressure"],
-                medication_names=["blood pressure tablets", "antihypertensive"],
-                symptoms=[],
-                medicare_number="3456789012",
-                medicare_number_masked="XXXX XXXX X12",
-                mentioned_doctor="Dr. Michael Wong",
-                mentioned_location=None
-            ),
-            "location_info": LocationInfo(
-                assigned_location="sunset",
-                location_confidence=0.85,
-                routing_reason="doctor_association",
-                available_locations=["harbour", "sunset", "central", "northside"]
-            ),
-            "patient_match": PatientMatchInfo(
-                medicare_matched=True,
-                patient_id="PAT-789012",
-                match_confidence=0.95,
-                previous_location="sunset"
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=True),
-                        "is_pii_safe": True,
-            "redacted_transcript": "Hello, this is [NAME REDACTED]. I need to speak to Dr Wong about my blood pressure tablets. I've completely run out and my chemist says they need a new script. I normally take them twice a day and haven't had any for two days now. My Medicare is [MEDICARE REDACTED]. Please call me back at ●●●●●●●456.",
-            "caller_phone_redacted": "●●●●●●●456",
-            "created_at": _get_recent_time(hours_ago=2),
-            "processed_at": _get_recent_time(hours_ago=1, minutes_ago=59),
-            "status": "processed"
-        },
-        {
-            "voicemail_id": "vm_20240115_demo003",
-            "language": "Mandarin Chinese",
-            "language_info": LanguageInfo(detected="Mandarin Chinese", code="zh", requires_interpreter=True),
-            "urgency": UrgencyInfo(level=2, reasoning="Routine appointment booking with no clinical urgency", confidence=0.92),
-            "intent": IntentType.BOOKING,
-            "summary": "Patient requesting to schedule a routine health check-up for next week at Central clinic",
-            "action_item": "Call back to schedule appointment at Central City Clinic - Mandarin interpreter required",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345123",
-                callback_number_raw="●●●●●●●123",
-                urgency_keywords=[],
-                symptoms=[],
-                medicare_number="4567890123",
-                medicare_number_masked="XXXX XXXX X23",
-                mentioned_doctor=None,
-                mentioned_location="Central City Clinic"
-            ),
-            "location_info": LocationInfo(
-                assigned_location="central",
-                location_confidence=0.95,
-                routing_reason="location_mentioned",
-                available_locations=["harbour", "sunset", "central", "northside"]
-            ),
-            "patient_match": PatientMatchInfo(
-                medicare_matched=True,
-                patient_id="PAT-890123",
-                match_confidence=0.95,
-                previous_location="central"
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "你好，我叫[NAME REDACTED]，我想在Central诊所预约下周的体检。我的Medicare号码是[MEDICARE REDACTED]。请回电话，谢谢。电话是●●●●●●●123。",
-            "caller_phone_redacted": "●●●●●●●123",
-            "created_at": _get_recent_time(hours_ago=5),
-            "processed_at": _get_recent_time(hours_ago=4, minutes_ago=45),
-            "status": "actioned"
-        },
-        {
-            "voicemail_id": "vm_20240115_demo004",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=3, reasoning="Patient inquiring about non-urgent test results", confidence=0.85),
-            "intent": IntentType.RESULTS,
-            "summary": "Patient calling to follow up on blood test results from last week",
-            "action_item": "Retrieve pathology results and arrange callback or appointment to discuss",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345567",
-                callback_number_raw="●●●●●●●567",
-                urgency_keywords=["blood test results"],
-                symptoms=[]
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "Hi there, it's [NAME REDACTED] calling about my blood test results from last week. The doctor said to call after a few days but I haven't heard anything. Can someone please let me know? My number is ●●●●●●●567.",
-            "caller_phone_redacted": "●●●●●●●567",
-            "created_at": _get_recent_time(hours_ago=3),
-            "processed_at": _get_recent_time(hours_ago=2, minutes_ago=59),
-            "status": "pending"
-        },
-        {
-            "voicemail_id": "vm_20240115_demo005",
-            "language": "Vietnamese",
-            "language_info": LanguageInfo(detected="Vietnamese", code="vi", requires_interpreter=True),
-            "urgency": UrgencyInfo(level=4, reasoning="Post-operative patient with concerning wound symptoms; patient sounds distressed", confidence=0.78),
-            "intent": IntentType.PRESCRIPTION,
-            "summary": "Post-surgery patient reporting redness and discharge from wound site",
-            "action_item": "URGENT: Arrange same-day review at Harbour Medical Centre for potential surgical site infection - Vietnamese interpreter required",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0422555890",
-                callback_number_raw="●●●●●●●890",
-                urgency_keywords=["redness", "discharge", "surgery", "worried"],
-                symptoms=["wound redness", "wound discharge", "post-operative concern"],
-                medicare_number="5678901234",
-                medicare_number_masked="XXXX XXXX X34",
-                mentioned_doctor="Dr. Lisa Patel",
-                mentioned_location=None
-            ),
-            "location_info": LocationInfo(
-                assigned_location="harbour",
-                location_confidence=0.85,
-                routing_reason="doctor_association",
-                available_locations=["harbour", "sunset", "central", "northside"]
-            ),
-            "patient_match": PatientMatchInfo(
-                medicare_matched=True,
-                patient_id="PAT-901234",
-                match_confidence=0.95,
-                previous_location="harbour"
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=True),
-            "is_pii_safe": True,
-            "redacted_transcript": "Xin chào, tôi là [NAME REDACTED]. Tôi vừa mổ với Dr Patel tuần trước và vết thương bắt đầu đỏ và có mủ. Medicare của tôi là [MEDICARE REDACTED]. Tôi lo lắng lắm. Xin gọi lại cho tôi ●●●●●●●890.",
-            "caller_phone_redacted": "●●●●●●●890",
-            "created_at": _get_recent_time(hours_ago=1),
-            "processed_at": _get_recent_time(minutes_ago=59),
-            "status": "processed"
-        },
-        {
-            "voicemail_id": "vm_20240115_demo006",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=1, reasoning="General feedback with no clinical content", confidence=0.98),
-            "intent": IntentType.OTHER,
-            "summary": "Patient calling to thank staff for excellent care during recent visit",
-            "action_item": "No action required - positive feedback for records",
-            "extracted_entities": ExtractedEntities(
-                callback_number=None,
-                urgency_keywords=[],
-                symptoms=[]
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "Hello, I just wanted to call and say thank you to everyone at the clinic. The service was wonderful during my last visit. Keep up the great work!",
-            "caller_phone_redacted": "●●●●●●●234",
-            "created_at": _get_recent_time(hours_ago=24),
-            "processed_at": _get_recent_time(hours_ago=23, minutes_ago=55),
-            "status": "archived"
-        },
-        {
-            "voicemail_id": "vm_20240115_demo007",
-            "language": "Greek",
-            "language_info": LanguageInfo(detected="Greek", code="el", requires_interpreter=True),
-            "urgency": UrgencyInfo(level=3, reasoning="Standard prescription renewal request", confidence=0.82),
-            "intent": IntentType.PRESCRIPTION,
-            "summary": "Patient requesting refill of diabetes medication - routine renewal",
-            "action_item": "Process standard script renewal for metformin - Greek interpreter may be needed for callback",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345345",
-                callback_number_raw="●●●●●●●345",
-                urgency_keywords=["prescription renewal"],
-                medication_names=["diabetes medication", "metformin"],
-                symptoms=[]
-            ),
-            "ui_state": UIState(is_ambiguous=False, needs_manual_listening=False, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "Γεια σας, είμαι ο/η [NAME REDACTED]. Χρειάζομαι ανανέωση της συνταγής για τα χάπια του διαβήτη μου. Παρακαλώ καλέστε με στο ●●●●●●●345.",
-            "caller_phone_redacted": "●●●●●●●345",
-            "created_at": _get_recent_time(hours_ago=4),
-            "processed_at": _get_recent_time(hours_ago=3, minutes_ago=55),
-            "status": "processed"
-        },
-        # New: Ambiguous/low confidence example - Heavy accent case
-        {
-            "voicemail_id": "vm_20240115_demo008",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=3, reasoning="Heavy accent detected - transcription may be inaccurate. Unable to confidently assess urgency.", confidence=0.35),
-            "intent": IntentType.AMBIGUOUS,
-            "summary": "Possible medication or pain complaint. Heavy accent - manual review recommended.",
-            "action_item": "MANUAL REVIEW: Listen to original recording - speaker has strong accent, AI transcription may be inaccurate",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345999",
-                callback_number_raw="●●●●●●●999",
-                urgency_keywords=["pain", "medication", "doctor"],
-                symptoms=["possible chest/back pain"]
-            ),
-            "ui_state": UIState(is_ambiguous=True, needs_manual_listening=True, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "Hallo, dis is [NAME REDACTED] calling. I am {{heving??having}} some problem wit my {{chest area??chest/test area}}, da pain is {{coming and going??coming in/going}} since yesterday. I {{tink??think/drink}} I need to see da doctor for dis. Also my {{madication??medication}}, da one for da blood pressure, I am running out. Please call me back on ●●●●●●●999. {{Tank??Thank}} you very much.",
-            "caller_phone_redacted": "●●●●●●●999",
-            "created_at": _get_recent_time(hours_ago=6),
-            "processed_at": _get_recent_time(hours_ago=5, minutes_ago=59),
-            "status": "pending"
-        },
-        # Another accent example - Strong Australian accent
-        {
-            "voicemail_id": "vm_20240115_demo009",
-            "language": "English",
-            "language_info": LanguageInfo(detected="English", code="en-AU", requires_interpreter=False),
-            "urgency": UrgencyInfo(level=3, reasoning="Strong regional accent affecting transcription accuracy. Content appears non-urgent but verification recommended.", confidence=0.42),
-            "intent": IntentType.AMBIGUOUS,
-            "summary": "Appointment or test results inquiry. Strong Australian accent - please verify by listening.",
-            "action_item": "MANUAL REVIEW: Listen to recording to confirm intent - heavy Australian slang/accent detected",
-            "extracted_entities": ExtractedEntities(
-                callback_number="0412345888",
-                callback_number_raw="●●●●●●●888",
-                urgency_keywords=[],
-                symptoms=[]
-            ),
-            "ui_state": UIState(is_ambiguous=True, needs_manual_listening=True, highlight_urgent=False),
-            "is_pii_safe": True,
-            "redacted_transcript": "G'day mate, it's [NAME REDACTED] here. Just wanna {{suss out??check/assess}} me blood test results from {{last arvo??last afternoon}}. The doc {{reckons??recommends/records}} I might need a {{squiz??look/check}} at 'em before me next appointment. {{Give us a bell??Give me a call}} when ya can, yeah? Cheers, ●●●●●●●888.",
-            "caller_phone_redacted": "●●●●●●●888",
-            "created_at": _get_recent_time(hours_ago=8),
-            "processed_at": _get_recent_time(hours_ago=7, minutes_ago=59),
-            "status": "pending"
-        },
-    ]
+# list_voicemails sort_by values -> sort key over VoicemailRow
+_LIST_SORT_KEYS = {
+    "created_at": attrgetter("created_us"),
+    "urgency": attrgetter("urgency_level"),
+    "status": attrgetter("status"),
+    "confidence": attrgetter("confidence")
+}
 
-    for vm_data in demo_voicemails:
-        vm = TriagedVoicemail(**vm_data)
-        voicemail_store[vm.voicemail_id] = vm
 
+# Demo voicemails, with times given in minutes before seeding; triggered
+# escalations get the current emergency script when seeded
+_DEMO_FIXTURES_PATH = Path(__file__).with_name("_demo_fixtures.json")
 
-# Seed demo data on module load
-_seed_demo_data()
+
+@lru_cache(maxsize=1)
+def _demo_fixture_bytes() -> bytes:
+    return _DEMO_FIXTURES_PATH.read_bytes()
+
+
+def seed_demo_data():
+    """
+    Seed demo data with enhanced entity extraction and confidence scores
+
+    Called from the app lifespan (see HEIDI_SEED_DEMO), not at import.
+    Each fixture is validated as one tree by TriagedVoicemail.model_validate.
+    """
+    now = datetime.utcnow()
+
+    for vm_data in json.loads(_demo_fixture_bytes()):
+        vm_data["created_at"] = now - timedelta(minutes=vm_data.pop("created_minutes_ago"))
+        vm_data["processed_at"] = now - timedelta(minutes=vm_data.pop("processed_minutes_ago"))
+        escalation = vm_data.get("escalation")
+        if escalation and "escalated_minutes_ago" in escalation:
+            escalated_at = now - timedelta(minutes=escalation.pop("escalated_minutes_ago"))
+            escalation["timestamp_escalated"] = escalated_at.isoformat() + "Z"
+        if escalation and escalation.get("escalation_triggered"):
+            escalation["emergency_script"] = EMERGENCY_SCRIPT_BILINGUAL
+        voicemail_store.upsert(TriagedVoicemail.model_validate(vm_data))
 
 
 @router.post("/triage", response_model=TriagedVoicemail)
@@ -383,36 +119,47 @@ async def triage_voicemail(voicemail: VoicemailInput):
     """
     try:
         result = await triage_service.triage(voicemail)
-        voicemail_store[result.voicemail_id] = result
-        return result
+        voicemail_store.upsert(result)
+        return model_response(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Triage processing failed: {str(e)}")
 
 
 @router.post("/triage/batch", response_model=BatchTriageResponse)
-async def batch_triage_voicemails(request: BatchTriageRequest, background_tasks: BackgroundTasks):
+async def batch_triage_voicemails(request: BatchTriageRequest):
     """
     Process multiple voicemails in batch
 
-    For large batches (>10), processing continues in background.
+    Voicemails are triaged concurrently (at most BATCH_TRIAGE_CONCURRENCY
+    at a time); results keep the request order.
     """
+    outcomes = await triage_service.triage_batch(request.voicemails, BATCH_TRIAGE_CONCURRENCY)
+
     results = []
     errors = []
 
-    for idx, voicemail in enumerate(request.voicemails):
-        try:
-            result = await triage_service.triage(voicemail)
-            voicemail_store[result.voicemail_id] = result
-            results.append(result)
-        except Exception as e:
-            errors.append({"index": idx, "error": str(e)})
+    for idx, outcome in enumerate(outcomes):
+        if isinstance(outcome, BaseException):
+            errors.append({"index": idx, "error": str(outcome)})
+        else:
+            voicemail_store.upsert(outcome)
+            results.append(outcome)
 
-    return BatchTriageResponse(
+    return model_response(BatchTriageResponse(
         processed_count=len(results),
         failed_count=len(errors),
         results=results,
         errors=errors
-    )
+    ))
+
+
+def _entity_or_transcript(needle: str, field: str) -> Callable[[VoicemailRow], bool]:
+    """Row predicate: `needle` occurs in the given entity text or the transcript"""
+    entity_text = attrgetter(field)
+    in_transcript = transcript_search.matching(needle)
+    if in_transcript is None:
+        return lambda r: needle in entity_text(r) or needle in r.transcript_text
+    return lambda r: r.voicemail_id in in_transcript or needle in entity_text(r)
 
 
 @router.get("/", response_model=VoicemailListResponse)
@@ -443,90 +190,78 @@ async def list_voicemails(
     - doctor: Filter by mentioned doctor
     - hide_old_actioned: Auto-hide actioned items older than 48 hours (default: True)
     """
-    items = list(voicemail_store.values())
-    now = datetime.utcnow()
+    # Filtering and sorting work on the store's flat VoicemailRow
+    # projections; only the requested page is mapped back to models.
+    # Status, intent and urgency filters are answered from the indexes;
+    # the remaining filters run over that (usually small) result.
+    rows = voicemail_store.select(
+        status=status or None,
+        intent=intent or None,
+        urgency_min=urgency_min or None,
+        urgency_max=urgency_max or None
+    )
+
+    # The remaining filters are collected as predicates, cheapest first,
+    # and applied in a single pass over the rows
+    predicates: List[Callable[[VoicemailRow], bool]] = []
 
     # Auto-hide old actioned items (but keep archived)
     if hide_old_actioned:
-        cutoff = now - timedelta(hours=ACTIONED_HIDE_HOURS)
-        items = [v for v in items if not (
-            v.status == "actioned" and v.created_at < cutoff
-        )]
-
-    # Apply filters
-    if status:
-        items = [v for v in items if v.status == status]
-    if urgency_min:
-        items = [v for v in items if v.urgency.level >= urgency_min]
-    if urgency_max:
-        items = [v for v in items if v.urgency.level <= urgency_max]
-    if intent:
-        items = [v for v in items if v.intent.value == intent]
+        hidden = old_actioned.advance(now_us())
+        if hidden:
+            predicates.append(lambda r: r.voicemail_id not in hidden)
+
     if ambiguous_only:
-        items = [v for v in items if v.intent == IntentType.AMBIGUOUS or
-                 (v.ui_state and v.ui_state.is_ambiguous)]
+        predicates.append(attrgetter("is_ambiguous"))
+
+    # Advanced filters match against lowercased search text precomputed
+    # on each row
 
     # Advanced filters - phone number
     if phone:
         phone_lower = phone.lower().replace(" ", "")
-        items = [v for v in items if (
-            (v.caller_phone_redacted and phone_lower in v.caller_phone_redacted.lower().replace(" ", "")) or
-            (v.extracted_entities and v.extracted_entities.callback_number and
-             phone_lower in v.extracted_entities.callback_number.lower().replace(" ", ""))
-        )]
+        predicates.append(lambda r: phone_lower in r.phone_text)
+
+    # Advanced filters - doctor
+    if doctor:
+        doctor_lower = doctor.lower()
+        predicates.append(lambda r: doctor_lower in r.doctor_text)
 
-    # Advanced filters - symptoms
+    # Advanced filters - symptoms (also search in transcript)
     if symptom:
-        symptom_lower = symptom.lower()
-        items = [v for v in items if (
-            v.extracted_entities and v.extracted_entities.symptoms and
-            any(symptom_lower in s.lower() for s in v.extracted_entities.symptoms)
-        ) or (
-            # Also search in transcript
-            v.redacted_transcript and symptom_lower in v.redacted_transcript.lower()
-        )]
+        predicates.append(_entity_or_transcript(symptom.lower(), "symptom_text"))
 
     # Advanced filters - medication
     if medication:
-        med_lower = medication.lower()
-        items = [v for v in items if (
-            v.extracted_entities and v.extracted_entities.medication_names and
-            any(med_lower in m.lower() for m in v.extracted_entities.medication_names)
-        ) or (
-            v.redacted_transcript and med_lower in v.redacted_transcript.lower()
-        )]
+        predicates.append(_entity_or_transcript(medication.lower(), "medication_text"))
 
-    # Advanced filters - doctor
-    if doctor:
-        doctor_lower = doctor.lower()
-        items = [v for v in items if (
-            v.extracted_entities and v.extracted_entities.mentioned_doctor and
-            doctor_lower in v.extracted_entities.mentioned_doctor.lower()
-        )]
+    if len(predicates) == 1:
+        rows = list(filter(predicates[0], rows))
+    elif predicates:
+        rows = [r for r in rows if all(p(r) for p in predicates)]
 
-    # Sort
+    # Sort and paginate. When the requested pages cover well under half of
+    # the matches, a bounded heap selection replaces the full sort; both
+    # give the same stable order.
+    key = _LIST_SORT_KEYS.get(sort_by, _LIST_SORT_KEYS["created_at"])
     reverse = sort_order == "desc"
-    if sort_by == "urgency":
-        items.sort(key=lambda x: x.urgency.level, reverse=reverse)
-    elif sort_by == "status":
-        items.sort(key=lambda x: x.status, reverse=reverse)
-    elif sort_by == "confidence":
-        items.sort(key=lambda x: x.urgency.confidence, reverse=reverse)
-    else:
-        items.sort(key=lambda x: x.created_at, reverse=reverse)
-
-    # Paginate
-    total = len(items)
+    total = len(rows)
     start = (page - 1) * page_size
     end = start + page_size
-    items = items[start:end]
+    if end < total // 2:
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        rows = select(end, rows, key=key)[start:]
+    else:
+        rows = sorted(rows, key=key, reverse=reverse)[start:end]
+    items = [voicemail_store[r.voicemail_id] for r in rows]
 
-    return VoicemailListResponse(
+    # Items are stored, already-validated models; skip re-validation
+    return model_response(VoicemailListResponse.model_construct(
         total=total,
         page=page,
         page_size=page_size,
         items=items
-    )
+    ))
 
 
 @router.get("/{voicemail_id}", response_model=TriagedVoicemail)
@@ -534,7 +269,7 @@ async def get_voicemail(voicemail_id: str):
     """Get a specific voicemail by ID"""
     if voicemail_id not in voicemail_store:
         raise HTTPException(status_code=404, detail="Voicemail not found")
-    return voicemail_store[voicemail_id]
+    return model_response(voicemail_store[voicemail_id])
 
 
 @router.patch("/{voicemail_id}", response_model=TriagedVoicemail)
@@ -543,44 +278,48 @@ async def update_voicemail(voicemail_id: str, update: UpdateVoicemailRequest):
     if voicemail_id not in voicemail_store:
         raise HTTPException(status_code=404, detail="Voicemail not found")
 
-    voicemail = voicemail_store[voicemail_id]
+    # Collect every change and apply them as one copy, so the stored
+    # model is replaced in a single step instead of mutated field by field
+    changes: Dict[str, Any] = {}
+    now = datetime.utcnow()
 
     # Basic updates
     if update.status:
-        voicemail.status = update.status
+        changes["status"] = update.status
     if update.assigned_to is not None:
-        voicemail.assigned_to = update.assigned_to
+        changes["assigned_to"] = update.assigned_to
     if update.notes is not None:
-        voicemail.notes = update.notes
+        changes["notes"] = update.notes
 
     # Callback tracking updates
     if update.callback_status:
-        voicemail.callback_status = update.callback_status
+        changes["callback_status"] = update.callback_status
         if update.callback_status == "attempted":
-            voicemail.callback_attempted_at = datetime.utcnow()
-        elif update.callback_status in ["successful", "no_answer", "left_message", "wrong_number"]:
-            voicemail.callback_completed_at = datetime.utcnow()
+            changes["callback_attempted_at"] = now
+        elif update.callback_status in _CALLBACK_COMPLETED_STATUSES:
+            changes["callback_completed_at"] = now
     if update.callback_by:
-        voicemail.callback_by = update.callback_by
+        changes["callback_by"] = update.callback_by
     if update.callback_notes:
-        voicemail.callback_notes = update.callback_notes
+        changes["callback_notes"] = update.callback_notes
 
     # Escalation acknowledgment
     if update.acknowledge_escalation:
-        voicemail.escalation_acknowledged = True
-        voicemail.escalation_acknowledged_at = datetime.utcnow()
-        voicemail.escalation_acknowledged_by = update.acknowledged_by
+        changes["escalation_acknowledged"] = True
+        changes["escalation_acknowledged_at"] = now
+        changes["escalation_acknowledged_by"] = update.acknowledged_by
 
     # PMS linking
     if update.pms_patient_id:
-        voicemail.pms_patient_id = update.pms_patient_id
-        voicemail.pms_linked = True
-        voicemail.pms_last_sync = datetime.utcnow()
+        changes["pms_patient_id"] = update.pms_patient_id
+        changes["pms_linked"] = True
+        changes["pms_last_sync"] = now
     if update.pms_system:
-        voicemail.pms_system = update.pms_system
+        changes["pms_system"] = update.pms_system
 
-    voicemail_store[voicemail_id] = voicemail
-    return voicemail
+    voicemail = voicemail_store[voicemail_id].model_copy(update=changes)
+    voicemail_store.upsert(voicemail)
+    return model_response(voicemail)
 
 
 @router.delete("/{voicemail_id}")
@@ -589,7 +328,7 @@ async def delete_voicemail(voicemail_id: str):
     if voicemail_id not in voicemail_store:
         raise HTTPException(status_code=404, detail="Voicemail not found")
 
-    del voicemail_store[voicemail_id]
+    voicemail_store.remove(voicemail_id)
     return {"status": "deleted", "voicemail_id": voicemail_id}
 
 
@@ -600,39 +339,40 @@ async def delete_voicemail(voicemail_id: str):
 @router.get("/duplicates/by-phone/{phone_hash}")
 async def get_duplicates_by_phone(phone_hash: str):
     """Get all voicemails from the same phone number"""
-    duplicates = [v for v in voicemail_store.values() if v.caller_phone_hash == phone_hash]
-    return {
+    rows = voicemail_store.select(phone_hash=phone_hash)
+    duplicates = [voicemail_store[r.voicemail_id] for r in sorted(rows, key=_LIST_SORT_KEYS["created_at"], reverse=True)]
+    return json_response({
         "phone_hash": phone_hash,
         "count": len(duplicates),
-        "voicemails": sorted(duplicates, key=lambda x: x.created_at, reverse=True)
-    }
+        "voicemails": duplicates
+    })
 
 
 @router.get("/duplicates/summary")
 async def get_duplicate_summary():
     """Get summary of repeat callers"""
-    phone_counts = {}
-    for v in voicemail_store.values():
-        if v.caller_phone_hash:
-            if v.caller_phone_hash not in phone_counts:
-                phone_counts[v.caller_phone_hash] = {
-                    "count": 0,
-                    "voicemail_ids": [],
-                    "phone_redacted": v.caller_phone_redacted,
-                    "latest_urgency": 0
-                }
-            phone_counts[v.caller_phone_hash]["count"] += 1
-            phone_counts[v.caller_phone_hash]["voicemail_ids"].append(v.voicemail_id)
-            if v.urgency.level > phone_counts[v.caller_phone_hash]["latest_urgency"]:
-                phone_counts[v.caller_phone_hash]["latest_urgency"] = v.urgency.level
-
-    # Filter to only repeat callers (2+ calls)
-    repeat_callers = {k: v for k, v in phone_counts.items() if v["count"] >= 2}
-
-    return {
+    # Only phone hashes with 2+ voicemails are read, each group in store
+    # order and groups ordered by their first voicemail
+    groups = [
+        voicemail_store.in_store_order(ids)
+        for ids in voicemail_store.by_phone_hash.values() if len(ids) >= 2
+    ]
+    groups.sort(key=lambda rows: voicemail_store.position(rows[0].voicemail_id))
+
+    repeat_callers = {}
+    for rows in groups:
+        first = rows[0]
+        repeat_callers[first.caller_phone_hash] = {
+            "count": len(rows),
+            "voicemail_ids": [r.voicemail_id for r in rows],
+            "phone_redacted": voicemail_store[first.voicemail_id].caller_phone_redacted,
+            "latest_urgency": max(r.urgency_level for r in rows)
+        }
+
+    return json_response({
         "total_repeat_callers": len(repeat_callers),
         "repeat_callers": repeat_callers
-    }
+    })
 
 
 # ============================================================================
@@ -660,20 +400,18 @@ async def record_callback(voicemail_id: str, callback_status: str, callback_by:
     if callback_status == "successful":
         voicemail.status = "actioned"
 
-    voicemail_store[voicemail_id] = voicemail
-    return voicemail
+    voicemail_store.upsert(voicemail)
+    return model_response(voicemail)
 
 
 @router.get("/callbacks/pending")
 async def get_pending_callbacks():
     """Get all voicemails needing callback"""
-    pending = [v for v in voicemail_store.values()
-               if v.callback_status in ["pending", "attempted", "no_answer"]
-               and v.status not in ["archived"]]
-    return {
+    pending = [voicemail_store[voicemail_id] for voicemail_id in pending_callbacks.ids()]
+    return json_response({
         "count": len(pending),
-        "voicemails": sorted(pending, key=lambda x: (x.urgency.level * -1, x.created_at))
-    }
+        "voicemails": pending
+    })
 
 
 # ============================================================================
@@ -684,29 +422,36 @@ async def get_pending_callbacks():
 async def get_active_escalations():
     """Get all active escalations that need attention"""
     active = []
-    now = datetime.utcnow()
-
-    for v in voicemail_store.values():
-        if v.escalation and v.escalation.escalation_triggered and not v.escalation_acknowledged:
-            # Calculate time since escalation
+    now_epoch_us = now_us()
+
+    # Only unacknowledged escalations are visited; their escalation times
+    # were parsed when the voicemail was stored
+    for r in voicemail_store.in_store_order(voicemail_store.active_escalations):
+        v = voicemail_store[r.voicemail_id]
+        # Calculate time since escalation
+        if r.escalated_us != MISSING_TIMESTAMP:
+            minutes_since = (now_epoch_us - r.escalated_us) / 1_000_000 / 60
+        else:
+            # Timestamp was not parseable when stored; parse it here so the
+            # failure surfaces as it always has
             escalated_at = datetime.fromisoformat(v.escalation.timestamp_escalated.replace('Z', '+00:00'))
-            minutes_since = (now - escalated_at.replace(tzinfo=None)).total_seconds() / 60
-
-            active.append({
-                "voicemail_id": v.voicemail_id,
-                "summary": v.summary,
-                "urgency_level": v.urgency.level,
-                "escalated_at": v.escalation.timestamp_escalated,
-                "minutes_since_escalation": round(minutes_since, 1),
-                "needs_re_alert": minutes_since > 15,  # Re-alert after 15 min
-                "reminder_count": v.escalation_reminder_count,
-                "callback_number": v.extracted_entities.callback_number if v.extracted_entities else None
-            })
-
-    return {
+            minutes_since = (datetime.utcnow() - escalated_at.replace(tzinfo=None)).total_seconds() / 60
+
+        active.append({
+            "voicemail_id": v.voicemail_id,
+            "summary": v.summary,
+            "urgency_level": v.urgency.level,
+            "escalated_at": v.escalation.timestamp_escalated,
+            "minutes_since_escalation": round(minutes_since, 1),
+            "needs_re_alert": minutes_since > 15,  # Re-alert after 15 min
+            "reminder_count": v.escalation_reminder_count,
+            "callback_number": v.extracted_entities.callback_number if v.extracted_entities else None
+        })
+
+    return json_response({
         "count": len(active),
         "escalations": sorted(active, key=lambda x: x["minutes_since_escalation"], reverse=True)
-    }
+    })
 
 
 @router.post("/{voicemail_id}/acknowledge-escalation")
@@ -721,7 +466,7 @@ async def acknowledge_escalation(voicemail_id: str, acknowledged_by: str):
     voicemail.escalation_acknowledged_at = datetime.utcnow()
     voicemail.escalation_acknowledged_by = acknowledged_by
 
-    voicemail_store[voicemail_id] = voicemail
+    voicemail_store.upsert(voicemail)
     return {"status": "acknowledged", "voicemail_id": voicemail_id}
 
 
@@ -739,7 +484,7 @@ async def send_escalation_reminder(voicemail_id: str):
     # In production, this would trigger actual SMS/notification
     print(f"🚨 REMINDER #{voicemail.escalation_reminder_count}: Unacknowledged Level 5 escalation for {voicemail_id}")
 
-    voicemail_store[voicemail_id] = voicemail
+    # Reminder fields are not indexed, so the in-place update needs no upsert
     return {
         "status": "reminder_sent",
         "reminder_count": voicemail.escalation_reminder_count
@@ -764,6 +509,16 @@ PMS_PATIENTS = {
     }
 }
 
+# Per PMS system: (patient_id, patient data, phone, lowercased name),
+# so searches do not re-read and re-lowercase every record
+_PMS_SEARCH_ROWS = {
+    pms_system: [
+        (pid, pdata, pdata.get("phone", ""), pdata.get("name", "").lower())
+        for pid, pdata in patients.items()
+    ]
+    for pms_system, patients in PMS_PATIENTS.items()
+}
+
 
 @router.get("/pms/search")
 async def search_pms_patient(
@@ -775,21 +530,21 @@ async def search_pms_patient(
     if pms_system not in PMS_PATIENTS:
         return {"error": f"Unknown PMS system: {pms_system}", "patients": []}
 
-    patients = PMS_PATIENTS[pms_system]
+    name_lower = name.lower() if name else None
     results = []
 
-    for pid, pdata in patients.items():
-        if phone and phone in pdata.get("phone", ""):
+    for pid, pdata, patient_phone, patient_name in _PMS_SEARCH_ROWS[pms_system]:
+        if phone and phone in patient_phone:
             results.append({"patient_id": pid, **pdata, "match_type": "phone"})
-        elif name and name.lower() in pdata.get("name", "").lower():
+        elif name_lower and name_lower in patient_name:
             results.append({"patient_id": pid, **pdata, "match_type": "name"})
 
-    return {
+    return json_response({
         "pms_system": pms_system,
         "query": {"phone": phone, "name": name},
         "count": len(results),
         "patients": results
-    }
+    })
 
 
 @router.post("/{voicemail_id}/link-pms")
@@ -805,7 +560,7 @@ async def link_to_pms(voicemail_id: str, pms_system: str, pms_patient_id: str):
     voicemail.pms_linked = True
     voicemail.pms_last_sync = datetime.utcnow()
 
-    voicemail_store[voicemail_id] = voicemail
+    # PMS fields are not indexed, so the in-place update needs no upsert
 
     return {
         "status": "linked",
@@ -835,7 +590,7 @@ async def create_pms_appointment(
     appointment_id = f"APT-{voicemail_id[-8:]}"
     voicemail.pms_appointment_id = appointment_id
 
-    voicemail_store[voicemail_id] = voicemail
+    # PMS fields are not indexed, so the in-place update needs no upsert
 
     return {
         "status": "appointment_created",
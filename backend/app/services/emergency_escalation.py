@@ -7,14 +7,21 @@ Features:
 - SMS notification to managers (simulated)
 - Voice alert script for patients
 - Intervention status tracking
+
+Simulated SMS and voice alerts are written to the "heidi.escalation" logger
+at DEBUG level; enable it to see them. When disabled the alert text is not
+built at all.
 """
 
+import logging
 from datetime import datetime
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+logger = logging.getLogger("heidi.escalation")
+
 
-@dataclass
+@dataclass(slots=True)
 class EscalationResult:
     """Result of emergency escalation process"""
     escalation_triggered: bool
@@ -41,6 +48,26 @@ EMERGENCY_SCRIPT_BILINGUAL = f"""[ENGLISH]
 [中文]
 {EMERGENCY_SCRIPT_ZH}"""
 
+# Manager SMS banner; only the placeholders vary between alerts
+_SMS_TEMPLATE = """
+╔══════════════════════════════════════════════╗
+║  🚨 HEIDI CALLS - EMERGENCY ALERT 🚨          ║
+╠══════════════════════════════════════════════╣
+║  Time: {time}
+║  Voicemail ID: {voicemail_id}
+║  Patient Phone: {patient_phone}
+║  Urgency: LEVEL {urgency_level} - CRITICAL
+║
+║  Summary:
+║  {summary}...
+║
+║  ⚡ Automated voice alert sent to patient
+║  ⚡ Advising patient to call 000 / go to ED
+║
+║  ACTION REQUIRED: Verify patient status
+╚══════════════════════════════════════════════╝
+"""
+
 
 class EmergencyEscalation:
     """
@@ -86,31 +113,19 @@ class EmergencyEscalation:
         """
         timestamp = datetime.utcnow().isoformat()
 
-        sms_content = f"""
-╔══════════════════════════════════════════════╗
-║  🚨 HEIDI CALLS - EMERGENCY ALERT 🚨          ║
-╠══════════════════════════════════════════════╣
-║  Time: {timestamp[:19]}
-║  Voicemail ID: {voicemail_id}
-║  Patient Phone: {patient_phone}
-║  Urgency: LEVEL {urgency_level} - CRITICAL
-║
-║  Summary:
-║  {summary[:60]}...
-║
-║  ⚡ Automated voice alert sent to patient
-║  ⚡ Advising patient to call 000 / go to ED
-║
-║  ACTION REQUIRED: Verify patient status
-╚══════════════════════════════════════════════╝
-"""
-
-        # SIMULATED: Print to console (in production, send actual SMS)
-        print("\n" + "=" * 50)
-        print("📱 SIMULATED SMS TO MANAGER:", self.manager_phone)
-        print("=" * 50)
-        print(sms_content)
-        print("=" * 50 + "\n")
+        # SIMULATED: Log the alert (in production, send actual SMS)
+        if logger.isEnabledFor(logging.DEBUG):
+            sms_content = _SMS_TEMPLATE.format(
+                time=timestamp[:19],
+                voicemail_id=voicemail_id,
+                patient_phone=patient_phone,
+                urgency_level=urgency_level,
+                summary=summary[:60]
+            )
+            logger.debug(
+                "\n%s\n📱 SIMULATED SMS TO MANAGER: %s\n%s\n%s\n%s\n",
+                "=" * 50, self.manager_phone, "=" * 50, sms_content, "=" * 50
+            )
 
         # Log the escalation
         self.escalation_log.append({
@@ -131,14 +146,11 @@ class EmergencyEscalation:
         """
         timestamp = datetime.utcnow().isoformat()
 
-        print("\n" + "=" * 50)
-        print("📞 SIMULATED VOICE ALERT TO PATIENT:", patient_phone)
-        print("=" * 50)
-        print("Script being played:")
-        print("-" * 50)
-        print(self.emergency_script)
-        print("-" * 50)
-        print("=" * 50 + "\n")
+        # SIMULATED: Log the call (in production, place the actual call)
+        logger.debug(
+            "\n%s\n📞 SIMULATED VOICE ALERT TO PATIENT: %s\n%s\nScript being played:\n%s\n%s\n%s\n%s\n",
+            "=" * 50, patient_phone, "=" * 50, "-" * 50, self.emergency_script, "-" * 50, "=" * 50
+        )
 
         # Log the voice alert
         self.escalation_log.append({
@@ -45,7 +45,17 @@ PATIENT_LOCATION_HISTORY = {
 }
 
 
-@dataclass
+# Medicare number candidates, tried in order
+# Medicare is 10 digits + optional Individual Reference Number (IRN)
+_MEDICARE_PATTERNS = (
+    re.compile(r'\b(\d{4})\s*(\d{5})\s*(\d{1,2})\b'),  # Spaced format
+    re.compile(r'\b(\d{10,11})\b'),  # Continuous digits
+)
+# Valid first digits of a Medicare number
+_MEDICARE_LEADING_DIGITS = frozenset('23456')
+
+
+@dataclass(slots=True)
 class RoutingResult:
     """Result of smart routing analysis"""
     assigned_location: Optional[str]
@@ -56,7 +66,7 @@ class RoutingResult:
     mentioned_location: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class MedicareResult:
     """Result of Medicare extraction"""
     medicare_number: Optional[str]
@@ -64,7 +74,7 @@ class MedicareResult:
     is_valid: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PatientMatchResult:
     """Result of patient matching"""
     matched: bool
@@ -89,6 +99,18 @@ class SmartRoutingService:
         self.doctors = KNOWN_DOCTORS
         self.patient_history = PATIENT_LOCATION_HISTORY
 
+        # Flattened lookup tables, in the same priority order as the config
+        self._location_keywords = tuple(
+            (keyword, location["id"]) for location in self.locations for keyword in location["keywords"]
+        )
+        self._doctor_aliases = tuple(
+            (alias, doctor["name"], doctor["location"]) for doctor in self.doctors for alias in doctor["aliases"]
+        )
+        self._location_names = {}
+        for location in self.locations:
+            self._location_names.setdefault(location["id"], location["name"])
+        self.location_ids = tuple(location["id"] for location in self.locations)
+
     # ========================================================================
     # MEDICARE EXTRACTION
     # ========================================================================
@@ -100,18 +122,9 @@ class SmartRoutingService:
         Australian Medicare format: XXXX XXXXX X (10 digits + 1 check digit)
         May appear as: 2345 67890 1, 2345678901, 2345-67890-1
         """
-        # Remove common separators and normalize
-        normalized = re.sub(r'[^\d]', '', text)
-
         # Look for 10-11 digit sequences
-        # Medicare is 10 digits + optional Individual Reference Number (IRN)
-        patterns = [
-            r'\b(\d{4})\s*(\d{5})\s*(\d{1,2})\b',  # Spaced format
-            r'\b(\d{10,11})\b',  # Continuous digits
-        ]
-
-        for pattern in patterns:
-            matches = re.findall(pattern, text)
+        for pattern in _MEDICARE_PATTERNS:
+            matches = pattern.findall(text)
             for match in matches:
                 if isinstance(match, tuple):
                     digits = ''.join(match)
@@ -121,7 +134,7 @@ class SmartRoutingService:
                 # Validate length (10 or 11 digits)
                 if 10 <= len(digits) <= 11:
                     # Basic validation: first digit should be 2-6
-                    if digits[0] in '23456':
+                    if digits[0] in _MEDICARE_LEADING_DIGITS:
                         masked = self._mask_medicare(digits)
                         return MedicareResult(
                             medicare_number=digits,
@@ -150,21 +163,17 @@ class SmartRoutingService:
 
     def extract_location(self, text: str) -> Optional[str]:
         """Extract mentioned clinic location from text"""
-        text_lower = text.lower()
-
-        for location in self.locations:
-            for keyword in location["keywords"]:
-                if keyword in text_lower:
-                    return location["id"]
+        return self._location_in(text.lower())
 
+    def _location_in(self, text_lower: str) -> Optional[str]:
+        for keyword, location_id in self._location_keywords:
+            if keyword in text_lower:
+                return location_id
         return None
 
     def get_location_name(self, location_id: str) -> Optional[str]:
         """Get full location name from ID"""
-        for location in self.locations:
-            if location["id"] == location_id:
-                return location["name"]
-        return None
+        return self._location_names.get(location_id)
 
     # ========================================================================
     # DOCTOR EXTRACTION
@@ -177,15 +186,27 @@ class SmartRoutingService:
         Returns:
             Tuple of (doctor_name, associated_location)
         """
-        text_lower = text.lower()
-
-        for doctor in self.doctors:
-            for alias in doctor["aliases"]:
-                if alias in text_lower:
-                    return doctor["name"], doctor["location"]
+        return self._doctor_in(text.lower())
 
+    def _doctor_in(self, text_lower: str) -> Tuple[Optional[str], Optional[str]]:
+        for alias, name, location_id in self._doctor_aliases:
+            if alias in text_lower:
+                return name, location_id
         return None, None
 
+    def extract_mentions(self, text: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Extract location and doctor mentions with a single lowercasing pass
+
+        Returns:
+            Tuple of (location_id, doctor_name, doctor_location)
+        """
+        if not text:
+            return None, None, None
+        text_lower = text.lower()
+        doctor_name, doctor_location = self._doctor_in(text_lower)
+        return self._location_in(text_lower), doctor_name, doctor_location
+
     # ========================================================================
     # SMART ROUTING
     # ========================================================================
@@ -193,7 +214,8 @@ class SmartRoutingService:
     def route_voicemail(
         self,
         transcript: str,
-        medicare_number: Optional[str] = None
+        medicare_number: Optional[str] = None,
+        mentions: Optional[Tuple[Optional[str], Optional[str], Optional[str]]] = None
     ) -> RoutingResult:
         """
         Determine the best clinic location for this voicemail
@@ -203,21 +225,31 @@ class SmartRoutingService:
         2. Doctor's associated location
         3. Patient's historical location (via Medicare)
         4. Default to None (requires manual assignment)
+
+        `mentions` takes a result of extract_mentions(transcript) that the
+        caller already has, to avoid scanning the transcript again.
         """
+        if mentions is not None:
+            mentioned_location, doctor_name, doctor_location = mentions
+        else:
+            text_lower = transcript.lower()
+            mentioned_location = self._location_in(text_lower)
+
         # Step 1: Check for explicit location mention
-        mentioned_location = self.extract_location(transcript)
         if mentioned_location:
+            location_name = self.get_location_name(mentioned_location)
             return RoutingResult(
                 assigned_location=mentioned_location,
-                location_name=self.get_location_name(mentioned_location),
+                location_name=location_name,
                 confidence=0.95,
                 routing_reason="location_mentioned",
                 mentioned_doctor=None,
-                mentioned_location=self.get_location_name(mentioned_location)
+                mentioned_location=location_name
             )
 
         # Step 2: Check for doctor mention
-        doctor_name, doctor_location = self.extract_doctor(transcript)
+        if mentions is None:
+            doctor_name, doctor_location = self._doctor_in(text_lower)
         if doctor_location:
             return RoutingResult(
                 assigned_location=doctor_location,
@@ -288,7 +320,7 @@ class SmartRoutingService:
 
     def get_all_locations(self) -> List[str]:
         """Get list of all available location IDs"""
-        return [loc["id"] for loc in self.locations]
+        return list(self.location_ids)
 
 
 # Singleton instance
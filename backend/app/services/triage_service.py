@@ -9,12 +9,17 @@ Features:
 - Actionable summary generation
 """
 
+import asyncio
+import hashlib
 import json
 import re
-from typing import Optional, Dict, Any, Tuple, List
+import secrets
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, List, Union
 from datetime import datetime
-import uuid
 import httpx
+import pydantic_core
 from dataclasses import dataclass
 
 from app.models.schemas import (
@@ -29,7 +34,7 @@ from app.models.schemas import (
     PatientMatchInfo,
     EscalationInfo
 )
-from app.utils.pii_filter import pii_filter
+from app.utils.pii_filter import pii_filter, strip_non_digits
 from app.services.smart_routing import smart_routing
 from app.services.emergency_escalation import emergency_escalation
 
@@ -160,7 +165,7 @@ Text: {text}
 Language:"""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TriageConfig:
     """Configuration for the triage service"""
     api_key: Optional[str] = None
@@ -168,6 +173,106 @@ class TriageConfig:
     max_tokens: int = 1024
     temperature: float = 0.1  # Low temperature for consistent clinical output
     api_base_url: str = "https://api.anthropic.com/v1"
+    # Identical prompts within the TTL reuse the earlier LLM response
+    response_cache_size: int = 4096
+    response_cache_ttl_seconds: float = 3600.0
+    # LLM API calls in flight at once, across all requests
+    max_concurrent_requests: int = 16
+    # Retries for rate-limited (429), 5xx and transport failures,
+    # waiting retry_backoff_seconds * 2**attempt before each
+    max_retries: int = 2
+    retry_backoff_seconds: float = 0.5
+
+
+@dataclass(slots=True)
+class TriageResult:
+    """Validated AI triage output with defaults applied"""
+    language: str
+    language_code: str
+    requires_interpreter: bool
+    urgency_level: int
+    urgency_reasoning: str
+    confidence: float
+    intent: str
+    summary: str
+    action_item: str
+
+
+# Response statuses worth retrying
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504, 529})
+
+# Mock triage keyword lists (matched as substrings of the lowercased
+# transcript); the language a keyword came from does not matter
+_EMERGENCY_KEYWORDS = (
+    "emergency", "chest pain", "can't breathe", "bleeding", "unconscious", "heart attack", "stroke",
+    "đau ngực", "khó thở", "chảy máu", "bất tỉnh", "cấp cứu", "đau tim",  # Vietnamese
+    "胸痛", "呼吸困难", "出血", "昏迷", "急诊", "心脏病",  # Chinese
+    "πόνος στο στήθος", "δυσκολία αναπνοής", "αιμορραγία",  # Greek
+)
+_HIGH_PRIORITY_KEYWORDS = (
+    "urgent", "ran out", "medication", "worse", "pain", "worried", "lo lắng",
+    "cấp bách", "hết thuốc", "tệ hơn", "đau",
+    "紧急", "没药了", "更糟", "疼痛",
+)
+_PRESCRIPTION_KEYWORDS = ("prescription", "refill", "medication", "pills", "tablets", "script", "thuốc", "药")
+_BOOKING_KEYWORDS = ("appointment", "book", "schedule", "reschedule", "预约", "đặt lịch")
+_RESULTS_KEYWORDS = ("results", "test", "blood work", "scan", "report", "kết quả", "结果")
+# Non-emergency intents, first match wins
+_INTENT_RULES = (
+    ("Prescription", _PRESCRIPTION_KEYWORDS),
+    ("Results", _RESULTS_KEYWORDS),
+    ("Booking", _BOOKING_KEYWORDS),
+)
+_VIETNAMESE_WORDS = ("xin", "chào", "tôi", "của", "gọi", "lại", "cảm ơn")
+
+# Script detection for the mock language guess: Vietnamese diacritics
+# (either case), CJK unified ideographs, Greek and Coptic
+_VIETNAMESE_LETTERS = 'àáảãạăằắẳẵặâầấẩẫậđèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵ'
+_VIETNAMESE_CHARS = frozenset(_VIETNAMESE_LETTERS + _VIETNAMESE_LETTERS.upper())
+_CJK_RANGE = range(0x4e00, 0xa000)
+_GREEK_RANGE = range(0x0370, 0x0400)
+
+_ACTION_BY_INTENT = {
+    "Emergency": "IMMEDIATE: Contact patient and advise to call 000 or present to ED immediately",
+    "Prescription": "Review with prescriber and arrange e-script if appropriate",
+    "Results": "Retrieve results and arrange callback or appointment to discuss",
+    "Booking": "Check availability and call back to confirm appointment",
+    "Other": "Review message and respond within standard timeframe"
+}
+_ATTENTION_LEVELS = ('routine', 'moderate', 'standard', 'urgent', 'immediate')
+
+_VALID_INTENTS = frozenset({"Booking", "Prescription", "Results", "Emergency", "Billing", "Referral", "Other"})
+
+# Fallback when an LLM response is not bare JSON: decode from each '{'
+_JSON_DECODER = json.JSONDecoder()
+
+# Australian phone patterns, tried in order
+_PHONE_PATTERNS = (
+    re.compile(r'0\d{3}\s?\d{3}\s?\d{3}'),  # 0412 345 678
+    re.compile(r'\+61\d{9}'),               # +61412345678
+    re.compile(r'04\d{8}'),                 # 0412345678
+)
+
+
+def _detect_script(text: str) -> str:
+    """
+    Code of the script seen in `text`, by precedence: "vi" for Vietnamese
+    diacritics, then "zh" for CJK, then "el" for Greek, else "en"
+
+    Works on the set of distinct characters, so the text is walked once
+    (in C) rather than once per script.
+    """
+    chars = set(text)
+    if not _VIETNAMESE_CHARS.isdisjoint(chars):
+        return "vi"
+    if not chars or max(chars) < '\u0370':
+        return "en"
+    codepoints = [ord(char) for char in chars]
+    if any(cp in _CJK_RANGE for cp in codepoints):
+        return "zh"
+    if any(cp in _GREEK_RANGE for cp in codepoints):
+        return "el"
+    return "en"
 
 
 class TriageService:
@@ -184,18 +289,50 @@ class TriageService:
     def __init__(self, config: Optional[TriageConfig] = None):
         self.config = config or TriageConfig()
         self._client = None
+        # Prompt key -> (monotonic time stored, response text), oldest first
+        self._response_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # Prompt key -> API call in progress, shared by identical requests
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # Created with the client, for the same event loop (see _bind_loop)
+        self._request_slots: Optional[asyncio.Semaphore] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
     
-    @property
-    def client(self) -> httpx.AsyncClient:
-        """Lazy initialization of HTTP client"""
-        if self._client is None:
+    def _bind_loop(self) -> None:
+        """
+        Lazy initialization of the HTTP client and request slots
+
+        Both belong to one event loop: the client's pooled connections and
+        the semaphore's waiters. When the running loop changes (e.g. a later
+        asyncio.run) they are replaced. The old client is closed on its own
+        loop only if that loop is still running (e.g. in another thread);
+        a stopped or closed loop would never run the close, so that client
+        is just dropped and its sockets go with it.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client_loop is not loop:
+            stale_client, stale_loop = self._client, self._client_loop
+            if stale_client is not None and stale_loop.is_running():
+                asyncio.run_coroutine_threadsafe(stale_client.aclose(), stale_loop)
+            limit = self.config.max_concurrent_requests
+            self._client_loop = loop
+            self._request_slots = asyncio.Semaphore(limit)
             self._client = httpx.AsyncClient(
-                timeout=30.0,
+                timeout=httpx.Timeout(30.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=limit,
+                    max_keepalive_connections=limit,
+                    keepalive_expiry=60.0
+                ),
                 headers={
                     "Content-Type": "application/json",
                     "anthropic-version": "2023-06-01"
                 }
             )
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for the running event loop"""
+        self._bind_loop()
         return self._client
     
     async def close(self):
@@ -203,12 +340,13 @@ class TriageService:
         if self._client:
             await self._client.aclose()
             self._client = None
+            self._request_slots = None
+            self._client_loop = None
     
     def generate_voicemail_id(self) -> str:
         """Generate a unique voicemail ID"""
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        short_uuid = str(uuid.uuid4())[:8]
-        return f"vm_{timestamp}_{short_uuid}"
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
+        return f"vm_{timestamp}_{secrets.token_hex(4)}"
     
     async def _call_llm(
         self, 
@@ -222,10 +360,56 @@ class TriageService:
         if not self.config.api_key:
             return self._mock_triage_response(user_message)
         
+        temperature = temperature or self.config.temperature
+        key = self._response_cache_key(system_prompt, user_message, temperature)
+        cached = self._cached_response(key)
+        if cached is not None:
+            return cached
+        
+        # Concurrent identical prompts wait on one API call. shield() keeps
+        # it running for the others if one waiting request is cancelled.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._request_llm(system_prompt, user_message, temperature))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish_request(key, done))
+        return await asyncio.shield(task)
+    
+    def _response_cache_key(self, system_prompt: str, user_message: str, temperature: float) -> str:
+        """Digest of everything that shapes the LLM response"""
+        config = self.config
+        material = json.dumps([config.model, config.max_tokens, temperature, system_prompt, user_message])
+        return hashlib.sha256(material.encode()).hexdigest()
+    
+    def _cached_response(self, key: str) -> Optional[str]:
+        """Cached response for key, if present and within the TTL"""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, text = entry
+        if time.monotonic() - stored_at > self.config.response_cache_ttl_seconds:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return text
+    
+    def _finish_request(self, key: str, task: asyncio.Task) -> None:
+        """Drop the in-flight entry and cache a successful response"""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        cache = self._response_cache
+        cache[key] = (time.monotonic(), task.result())
+        cache.move_to_end(key)
+        while len(cache) > self.config.response_cache_size:
+            cache.popitem(last=False)
+    
+    async def _request_llm(self, system_prompt: str, user_message: str, temperature: float) -> str:
+        """Call the messages API (uncached)"""
         payload = {
             "model": self.config.model,
             "max_tokens": self.config.max_tokens,
-            "temperature": temperature or self.config.temperature,
+            "temperature": temperature,
             "system": system_prompt,
             "messages": [
                 {"role": "user", "content": user_message}
@@ -238,12 +422,27 @@ class TriageService:
             "anthropic-version": "2023-06-01"
         }
         
-        response = await self.client.post(
-            f"{self.config.api_base_url}/messages",
-            json=payload,
-            headers=headers
-        )
-        response.raise_for_status()
+        self._bind_loop()
+        async with self._request_slots:
+            attempt = 0
+            while True:
+                try:
+                    response = await self.client.post(
+                        f"{self.config.api_base_url}/messages",
+                        json=payload,
+                        headers=headers
+                    )
+                    response.raise_for_status()
+                    break
+                except (httpx.TransportError, httpx.HTTPStatusError) as exc:
+                    retryable = (
+                        isinstance(exc, httpx.TransportError) or
+                        exc.response.status_code in _RETRYABLE_STATUS_CODES
+                    )
+                    if not retryable or attempt >= self.config.max_retries:
+                        raise
+                    await asyncio.sleep(self.config.retry_backoff_seconds * 2 ** attempt)
+                    attempt += 1
         
         result = response.json()
         return result["content"][0]["text"]
@@ -253,26 +452,6 @@ class TriageService:
 
         transcript_lower = transcript.lower()
 
-        # ================================================================
-        # MULTILINGUAL EMERGENCY KEYWORDS
-        # ================================================================
-        emergency_keywords = {
-            "en": ["emergency", "chest pain", "can't breathe", "bleeding", "unconscious", "heart attack", "stroke"],
-            "vi": ["đau ngực", "khó thở", "chảy máu", "bất tỉnh", "cấp cứu", "đau tim"],  # Vietnamese
-            "zh": ["胸痛", "呼吸困难", "出血", "昏迷", "急诊", "心脏病"],  # Chinese
-            "el": ["πόνος στο στήθος", "δυσκολία αναπνοής", "αιμορραγία"],  # Greek
-        }
-
-        high_priority_keywords = {
-            "en": ["urgent", "ran out", "medication", "worse", "pain", "worried", "lo lắng"],
-            "vi": ["cấp bách", "hết thuốc", "tệ hơn", "đau", "lo lắng"],
-            "zh": ["紧急", "没药了", "更糟", "疼痛"],
-        }
-
-        prescription_keywords = ["prescription", "refill", "medication", "pills", "tablets", "script", "thuốc", "药"]
-        booking_keywords = ["appointment", "book", "schedule", "reschedule", "预约", "đặt lịch"]
-        results_keywords = ["results", "test", "blood work", "scan", "report", "kết quả", "结果"]
-
         # ================================================================
         # LANGUAGE DETECTION (Enhanced)
         # ================================================================
@@ -280,25 +459,21 @@ class TriageService:
         language_code = "en"
         requires_interpreter = False
 
-        # Vietnamese detection (Latin script with diacritics)
-        vietnamese_chars = re.search(r'[àáảãạăằắẳẵặâầấẩẫậđèéẻẽẹêềếểễệìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳýỷỹỵ]', transcript, re.IGNORECASE)
-        vietnamese_words = any(w in transcript_lower for w in ["xin", "chào", "tôi", "của", "gọi", "lại", "cảm ơn"])
-
-        # Chinese detection
-        chinese_chars = re.search(r'[\u4e00-\u9fff]', transcript)
+        # Script detection (Vietnamese diacritics, Chinese, Greek) in one pass
+        script = _detect_script(transcript)
 
-        # Greek detection
-        greek_chars = re.search(r'[\u0370-\u03ff]', transcript)
+        # Vietnamese written without diacritics
+        vietnamese_words = any(w in transcript_lower for w in _VIETNAMESE_WORDS)
 
-        if vietnamese_chars or vietnamese_words:
+        if script == "vi" or vietnamese_words:
             language = "Vietnamese"
             language_code = "vi"
             requires_interpreter = True
-        elif chinese_chars:
+        elif script == "zh":
             language = "Mandarin Chinese"
             language_code = "zh"
             requires_interpreter = True
-        elif greek_chars:
+        elif script == "el":
             language = "Greek"
             language_code = "el"
             requires_interpreter = True
@@ -311,17 +486,8 @@ class TriageService:
         confidence = 0.85
 
         # Check emergency keywords across all languages
-        is_emergency = False
-        for lang, keywords in emergency_keywords.items():
-            if any(kw in transcript_lower for kw in keywords):
-                is_emergency = True
-                break
-
-        is_high_priority = False
-        for lang, keywords in high_priority_keywords.items():
-            if any(kw in transcript_lower for kw in keywords):
-                is_high_priority = True
-                break
+        is_emergency = any(kw in transcript_lower for kw in _EMERGENCY_KEYWORDS)
+        is_high_priority = any(kw in transcript_lower for kw in _HIGH_PRIORITY_KEYWORDS)
 
         if is_emergency:
             urgency_level = 5
@@ -338,34 +504,23 @@ class TriageService:
         intent = "Other"
         if is_emergency:
             intent = "Emergency"
-        elif any(kw in transcript_lower for kw in prescription_keywords):
-            intent = "Prescription"
-        elif any(kw in transcript_lower for kw in results_keywords):
-            intent = "Results"
-        elif any(kw in transcript_lower for kw in booking_keywords):
-            intent = "Booking"
+        else:
+            for rule_intent, keywords in _INTENT_RULES:
+                if any(kw in transcript_lower for kw in keywords):
+                    intent = rule_intent
+                    break
 
         # ================================================================
         # ACTION ITEM
         # ================================================================
-        action_map = {
-            "Emergency": "IMMEDIATE: Contact patient and advise to call 000 or present to ED immediately",
-            "Prescription": "Review with prescriber and arrange e-script if appropriate",
-            "Results": "Retrieve results and arrange callback or appointment to discuss",
-            "Booking": "Check availability and call back to confirm appointment",
-            "Other": "Review message and respond within standard timeframe"
-        }
-
         # Add interpreter note for non-English
-        action = action_map.get(intent, action_map["Other"])
+        action = _ACTION_BY_INTENT.get(intent, _ACTION_BY_INTENT["Other"])
         if requires_interpreter:
             action += f" - {language} interpreter required"
 
         # ================================================================
         # BUILD RESPONSE
         # ================================================================
-        attention_levels = ['routine', 'moderate', 'standard', 'urgent', 'immediate']
-
         mock_response = {
             "language": language,
             "language_code": language_code,
@@ -376,15 +531,24 @@ class TriageService:
                 "confidence": confidence
             },
             "intent": intent,
-            "summary": f"Patient message regarding {intent.lower()} matter - requires {attention_levels[urgency_level-1]} attention",
+            "summary": f"Patient message regarding {intent.lower()} matter - requires {_ATTENTION_LEVELS[urgency_level-1]} attention",
             "action_item": action
         }
 
-        return json.dumps(mock_response)
+        return pydantic_core.to_json(mock_response).decode()
     
     def _parse_triage_response(self, response: str) -> Dict[str, Any]:
         """Parse and validate the LLM response"""
         
+        # Common case: the response is the JSON object alone (pydantic-core's
+        # parser is a few times faster than json.loads here)
+        stripped = response.strip()
+        if stripped.startswith("{"):
+            try:
+                return pydantic_core.from_json(stripped)
+            except ValueError:
+                pass
+        
         # Try to extract JSON from response
         try:
             # Handle potential markdown code blocks
@@ -396,10 +560,13 @@ class TriageService:
             return json.loads(response.strip())
         
         except json.JSONDecodeError:
-            # Fallback: try to find JSON object in response
-            json_match = re.search(r'\{[\s\S]*\}', response)
-            if json_match:
-                return json.loads(json_match.group())
+            # Fallback: the first JSON object embedded in the response
+            start = response.find("{")
+            while start != -1:
+                try:
+                    return _JSON_DECODER.raw_decode(response, start)[0]
+                except json.JSONDecodeError:
+                    start = response.find("{", start + 1)
             
             # If all fails, return default
             return {
@@ -410,33 +577,35 @@ class TriageService:
                 "action_item": "Manual review required - AI processing error"
             }
     
-    def _validate_triage_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def _validate_triage_output(self, data: Dict[str, Any]) -> TriageResult:
         """Validate and normalize the triage output"""
-        
-        # Ensure urgency level is in range
-        if "urgency" in data:
-            data["urgency"]["level"] = max(1, min(5, data["urgency"].get("level", 3)))
+        urgency = data.get("urgency") or {}
         
         # Normalize intent
-        valid_intents = ["Booking", "Prescription", "Results", "Emergency", "Billing", "Referral", "Other"]
-        if data.get("intent") not in valid_intents:
-            data["intent"] = "Other"
+        intent = data.get("intent")
+        if intent not in _VALID_INTENTS:
+            intent = "Other"
         
-        return data
+        return TriageResult(
+            language=data.get("language", "Unknown"),
+            language_code=data.get("language_code", "en"),
+            requires_interpreter=data.get("requires_interpreter", False),
+            # Ensure urgency level is in range
+            urgency_level=max(1, min(5, urgency.get("level", 3))),
+            urgency_reasoning=urgency.get("reasoning", ""),
+            confidence=urgency.get("confidence", 0.85),
+            intent=intent,
+            summary=data.get("summary", ""),
+            action_item=data.get("action_item", "")
+        )
     
     def _extract_phone_from_text(self, text: str) -> Tuple[Optional[str], Optional[str]]:
         """Extract phone number from transcript"""
-        # Australian phone patterns
-        patterns = [
-            r'0\d{3}\s?\d{3}\s?\d{3}',  # 0412 345 678
-            r'\+61\d{9}',               # +61412345678
-            r'04\d{8}',                 # 0412345678
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _PHONE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 raw = match.group()
-                normalized = re.sub(r'\s', '', raw)
+                normalized = ''.join(raw.split())
                 return normalized, self._redact_phone_display(normalized)
         return None, None
 
@@ -448,87 +617,48 @@ class TriageService:
         1. Generate unique ID
         2. Apply PII redaction
         3. Call AI for triage
-        4. Extract entities (phone, Medicare, symptoms)
-        5. Smart routing
-        6. Emergency escalation (if Level 5)
-        7. Construct response
+        4. Parse and validate the AI response
+        5. Extract entities (phone, Medicare, mentions), concurrently with 3
+        6. Smart routing and patient matching
+        7. Emergency escalation (if Level 5)
+        8. Construct response
         """
 
         # Step 1: Generate ID
         voicemail_id = self.generate_voicemail_id()
 
+        # Nothing to triage in a blank transcript (silence, hang-up)
+        if voicemail.transcript.isspace():
+            return self._blank_transcript_triage(voicemail_id, voicemail)
+
         # Step 2: PII Redaction
         redacted_transcript, pii_matches, is_pii_safe = pii_filter.redact(
             voicemail.transcript
         )
 
-        # Step 3: AI Triage
-        ai_response = await self._call_llm(
+        # Step 3: AI Triage. Entity extraction and routing (steps 5-6)
+        # only read the transcript, so with a real API call they run in a
+        # worker thread while the request is in flight
+        llm_call = self._call_llm(
             MEDICAL_TRIAGE_SYSTEM_PROMPT,
             f"Analyze this voicemail transcript:\n\n{redacted_transcript}"
         )
+        if self.config.api_key:
+            ai_response, entities = await asyncio.gather(
+                llm_call, asyncio.to_thread(self._extract_entities, voicemail)
+            )
+        else:
+            ai_response = await llm_call
+            entities = self._extract_entities(voicemail)
+        extracted_entities, location_info, patient_match = entities
+        callback_number = extracted_entities.callback_number
 
         # Step 4: Parse and validate
-        triage_data = self._parse_triage_response(ai_response)
-        triage_data = self._validate_triage_output(triage_data)
-
-        urgency_level = triage_data["urgency"]["level"]
-        intent = triage_data.get("intent", "Other")
-        confidence = triage_data["urgency"].get("confidence", 0.85)
-
-        # Step 5: Entity Extraction
-        # Extract phone from original transcript
-        callback_number, callback_masked = self._extract_phone_from_text(voicemail.transcript)
-        if not callback_number and voicemail.caller_phone:
-            callback_number = voicemail.caller_phone
-            callback_masked = self._redact_phone_display(voicemail.caller_phone)
-
-        # Extract Medicare from original transcript
-        medicare_result = smart_routing.extract_medicare(voicemail.transcript)
-
-        # Build extracted entities
-        extracted_entities = ExtractedEntities(
-            callback_number=callback_number,
-            callback_number_raw=callback_masked,
-            urgency_keywords=[],
-            symptoms=[],
-            medication_names=[],
-            medicare_number=medicare_result.medicare_number,
-            medicare_number_masked=medicare_result.medicare_masked,
-            mentioned_doctor=None,
-            mentioned_location=None
-        )
-
-        # Extract doctor and location mentions
-        doctor_name, doctor_location = smart_routing.extract_doctor(voicemail.transcript)
-        if doctor_name:
-            extracted_entities.mentioned_doctor = doctor_name
-
-        mentioned_loc = smart_routing.extract_location(voicemail.transcript)
-        if mentioned_loc:
-            extracted_entities.mentioned_location = smart_routing.get_location_name(mentioned_loc)
-
-        # Step 6: Smart Routing
-        routing_result = smart_routing.route_voicemail(
-            voicemail.transcript,
-            medicare_result.medicare_number
-        )
-
-        location_info = LocationInfo(
-            assigned_location=routing_result.assigned_location,
-            location_confidence=routing_result.confidence,
-            routing_reason=routing_result.routing_reason,
-            available_locations=smart_routing.get_all_locations()
-        ) if routing_result.assigned_location else None
+        triage_result = self._validate_triage_output(self._parse_triage_response(ai_response))
 
-        # Patient matching
-        patient_match_result = smart_routing.match_patient(medicare_result.medicare_number)
-        patient_match = PatientMatchInfo(
-            medicare_matched=patient_match_result.matched,
-            patient_id=patient_match_result.patient_id,
-            match_confidence=patient_match_result.confidence,
-            previous_location=patient_match_result.previous_location
-        ) if patient_match_result.matched else None
+        urgency_level = triage_result.urgency_level
+        intent = triage_result.intent
+        confidence = triage_result.confidence
 
         # Step 7: Emergency Escalation (Level 5)
         escalation_info = None
@@ -537,7 +667,7 @@ class TriageService:
                 voicemail_id=voicemail_id,
                 urgency_level=urgency_level,
                 intent=intent,
-                summary=triage_data.get("summary", ""),
+                summary=triage_result.summary,
                 patient_phone=callback_number
             )
             if escalation_result.escalation_triggered:
@@ -553,9 +683,9 @@ class TriageService:
 
         # Step 8: Build Language Info
         language_info = LanguageInfo(
-            detected=triage_data.get("language", "Unknown"),
-            code=triage_data.get("language_code", "en"),
-            requires_interpreter=triage_data.get("requires_interpreter", False)
+            detected=triage_result.language,
+            code=triage_result.language_code,
+            requires_interpreter=triage_result.requires_interpreter
         )
 
         # Step 9: UI State
@@ -569,16 +699,16 @@ class TriageService:
         # Step 10: Construct response
         return TriagedVoicemail(
             voicemail_id=voicemail_id,
-            language=triage_data.get("language", "Unknown"),
+            language=triage_result.language,
             language_info=language_info,
             urgency=UrgencyInfo(
                 level=urgency_level,
-                reasoning=triage_data["urgency"]["reasoning"],
+                reasoning=triage_result.urgency_reasoning,
                 confidence=confidence
             ),
             intent=IntentType(intent),
-            summary=triage_data.get("summary", ""),
-            action_item=triage_data.get("action_item", ""),
+            summary=triage_result.summary,
+            action_item=triage_result.action_item,
             extracted_entities=extracted_entities,
             location_info=location_info,
             patient_match=patient_match,
@@ -593,12 +723,127 @@ class TriageService:
             status="processed"
         )
     
+    def _blank_transcript_triage(self, voicemail_id: str, voicemail: VoicemailInput) -> TriagedVoicemail:
+        """Low-urgency result for a whitespace-only transcript, flagged for manual listening"""
+        callback_masked = self._redact_phone_display(voicemail.caller_phone)
+        return TriagedVoicemail(
+            voicemail_id=voicemail_id,
+            language="Unknown",
+            language_info=LanguageInfo(detected="Unknown"),
+            urgency=UrgencyInfo(
+                level=1,
+                reasoning="Empty transcript - no spoken content detected",
+                confidence=0.0
+            ),
+            intent=IntentType.OTHER,
+            summary="Empty voicemail",
+            action_item="Manual review - incomplete message",
+            extracted_entities=ExtractedEntities(
+                callback_number=voicemail.caller_phone or None,
+                callback_number_raw=callback_masked
+            ),
+            ui_state=UIState(is_ambiguous=True, needs_manual_listening=True),
+            is_pii_safe=True,
+            original_transcript=voicemail.transcript,
+            redacted_transcript=voicemail.transcript,
+            caller_phone_redacted=callback_masked,
+            created_at=voicemail.call_timestamp or datetime.utcnow(),
+            processed_at=datetime.utcnow(),
+            status="processed"
+        )
+
+    def _extract_entities(
+        self,
+        voicemail: VoicemailInput
+    ) -> Tuple[ExtractedEntities, Optional[LocationInfo], Optional[PatientMatchInfo]]:
+        """Entity extraction, smart routing and patient matching (triage steps 5-6)"""
+
+        # Step 5: Entity Extraction
+        # Extract phone from original transcript
+        callback_number, callback_masked = self._extract_phone_from_text(voicemail.transcript)
+        if not callback_number and voicemail.caller_phone:
+            callback_number = voicemail.caller_phone
+            callback_masked = self._redact_phone_display(voicemail.caller_phone)
+
+        # Extract Medicare from original transcript
+        medicare_result = smart_routing.extract_medicare(voicemail.transcript)
+
+        # Build extracted entities
+        extracted_entities = ExtractedEntities(
+            callback_number=callback_number,
+            callback_number_raw=callback_masked,
+            urgency_keywords=[],
+            symptoms=[],
+            medication_names=[],
+            medicare_number=medicare_result.medicare_number,
+            medicare_number_masked=medicare_result.medicare_masked,
+            mentioned_doctor=None,
+            mentioned_location=None
+        )
+
+        # Extract doctor and location mentions
+        mentions = smart_routing.extract_mentions(voicemail.transcript)
+        mentioned_loc, doctor_name, doctor_location = mentions
+        if doctor_name:
+            extracted_entities.mentioned_doctor = doctor_name
+
+        if mentioned_loc:
+            extracted_entities.mentioned_location = smart_routing.get_location_name(mentioned_loc)
+
+        # Step 6: Smart Routing
+        routing_result = smart_routing.route_voicemail(
+            voicemail.transcript,
+            medicare_result.medicare_number,
+            mentions=mentions
+        )
+
+        location_info = LocationInfo(
+            assigned_location=routing_result.assigned_location,
+            location_confidence=routing_result.confidence,
+            routing_reason=routing_result.routing_reason,
+            # Tuple of all IDs; validation builds the model's own list from it
+            available_locations=smart_routing.location_ids
+        ) if routing_result.assigned_location else None
+
+        # Patient matching
+        patient_match_result = smart_routing.match_patient(medicare_result.medicare_number)
+        patient_match = PatientMatchInfo(
+            medicare_matched=patient_match_result.matched,
+            patient_id=patient_match_result.patient_id,
+            match_confidence=patient_match_result.confidence,
+            previous_location=patient_match_result.previous_location
+        ) if patient_match_result.matched else None
+
+        return extracted_entities, location_info, patient_match
+
+    async def triage_batch(
+        self,
+        voicemails: List[VoicemailInput],
+        concurrency: int = 16
+    ) -> List[Union[TriagedVoicemail, BaseException]]:
+        """
+        Triage several voicemails concurrently, at most `concurrency` at a time
+
+        Results are in input order; a voicemail whose triage failed gets
+        its exception in place of a result.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def triage_one(voicemail: VoicemailInput) -> TriagedVoicemail:
+            async with semaphore:
+                return await self.triage(voicemail)
+
+        return await asyncio.gather(
+            *(triage_one(voicemail) for voicemail in voicemails),
+            return_exceptions=True
+        )
+
     def _redact_phone_display(self, phone: Optional[str]) -> Optional[str]:
         """Partially mask phone number for display"""
         if not phone:
             return None
         # Keep last 4 digits
-        digits = re.sub(r'\D', '', phone)
+        digits = strip_non_digits(phone)
         if len(digits) >= 4:
             return "●" * (len(digits) - 4) + digits[-4:]
         return "●" * len(digits)
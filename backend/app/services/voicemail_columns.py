@@ -0,0 +1,61 @@
+"""
+Heidi Calls: Voicemail Columns
+Struct-of-arrays view of the voicemail fields analytics scans
+
+Features:
+- One compact typed array per field instead of one object per voicemail
+- Only the fields a full scan reads: creation time and urgency level (the
+  urgency timeline); counters come from the analytics aggregator
+- Timestamps as integer microseconds since the Unix epoch (UTC), as
+  computed on the store rows (clock.MISSING_TIMESTAMP when absent)
+- Kept in sync with the voicemail store through the listener hooks
+"""
+
+from array import array
+from typing import Dict, List
+
+from app.services.voicemail_store import StoreListener, VoicemailRow
+
+
+class VoicemailColumns(StoreListener):
+    """
+    Parallel arrays indexed by slot, one slot per stored voicemail
+
+    Slots are dense: removing a voicemail moves the last slot into the
+    hole, so a full scan is a straight walk over each array. Slot order
+    is therefore arbitrary.
+    """
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self._slots: Dict[str, int] = {}
+
+        self.urgency = array("B")
+        self.created_us = array("q")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def on_upsert(self, row: VoicemailRow) -> None:
+        slot = self._slots.get(row.voicemail_id)
+        if slot is None:
+            self._slots[row.voicemail_id] = len(self.ids)
+            self.ids.append(row.voicemail_id)
+            self.urgency.append(row.urgency_level)
+            self.created_us.append(row.created_us)
+        else:
+            self.urgency[slot] = row.urgency_level
+            self.created_us[slot] = row.created_us
+
+    def on_remove(self, row: VoicemailRow) -> None:
+        slot = self._slots.pop(row.voicemail_id, None)
+        if slot is None:
+            return
+        last = len(self.ids) - 1
+        columns = (self.ids, self.urgency, self.created_us)
+        if slot != last:
+            for column in columns:
+                column[slot] = column[last]
+            self._slots[self.ids[slot]] = slot
+        for column in columns:
+            column.pop()
@@ -0,0 +1,503 @@
+"""
+Heidi Calls: Voicemail Store
+In-memory voicemail storage with write-time hooks for derived views
+
+Features:
+- Dict-style access keyed by voicemail_id
+- Secondary indexes by status, intent, urgency and caller phone hash
+- Set of unacknowledged escalations, with parsed escalation times
+- Indexed selection for list filters, in store order
+- Slotted row projections of the fields aggregates read
+- Lowercased search text precomputed per voicemail for list text filters
+- Listener hooks so aggregates stay current without rescanning the store
+- Lazily advanced "created too long ago in this status" sets
+- Incrementally sorted views of the rows matching a condition
+- Flat-buffer substring scans for text filters
+
+State is per process. Routers and listeners only touch it through
+upsert/remove, item access and select(), so a shared backend can replace
+this class without changes to callers.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass
+from itertools import accumulate
+from datetime import datetime
+from typing import Any, Callable, Collection, Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple, ValuesView, ItemsView, KeysView
+
+from app.models.schemas import IntentType, TriagedVoicemail
+from app.utils.clock import MISSING_TIMESTAMP, epoch_us
+
+
+def _index_add(index: Dict[Hashable, Set[str]], key: Hashable, voicemail_id: str) -> None:
+    index.setdefault(key, set()).add(voicemail_id)
+
+
+def _index_discard(index: Dict[Hashable, Set[str]], key: Hashable, voicemail_id: str) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(voicemail_id)
+        if not ids:
+            del index[key]
+
+
+# Joins several values into one search string. It does not occur in
+# voicemail text, so a filter term cannot match across two joined values.
+SEARCH_SEPARATOR = "\x00"
+
+
+def _search_text(values: Iterable[Optional[str]]) -> str:
+    return SEARCH_SEPARATOR.join(value.lower() for value in values if value)
+
+
+def escalated_epoch_us(timestamp: Optional[str]) -> int:
+    """
+    Parse an escalation ISO timestamp to epoch microseconds
+
+    Any UTC offset is dropped rather than applied, matching how escalation
+    ages have always been computed. Returns MISSING_TIMESTAMP when the
+    timestamp is absent or unparseable.
+    """
+    try:
+        escalated_at = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return MISSING_TIMESTAMP
+    return epoch_us(escalated_at.replace(tzinfo=None))
+
+
+@dataclass(slots=True)
+class VoicemailRow:
+    """
+    Flat, slotted copy of the voicemail fields that indexes, analytics and
+    list filtering use
+
+    Rows are rebuilt on every upsert and never mutated, so a listener can
+    keep the previous row to undo its old contribution. The Pydantic model
+    stays the source of truth for everything else.
+
+    Enum-backed fields are unwrapped here so hot loops hash and compare
+    plain ints/strs without going through enum attribute access. Likewise
+    timestamps are kept only as epoch ints, not datetime objects.
+
+    The *_text fields hold lowercased search strings for the list text
+    filters, so a filter is one substring test per voicemail:
+    phone_text has spaces removed from caller and callback numbers, list
+    fields are joined with SEARCH_SEPARATOR.
+    """
+    voicemail_id: str
+    status: str
+    callback_status: Optional[str]
+    urgency_level: int  # plain int, never a UrgencyLevel member
+    confidence: float
+    intent: str  # IntentType value, resolved once per write
+    is_ambiguous: bool  # Ambiguous intent or flagged ambiguous by the UI state
+    language: str
+    assigned_to: Optional[str]
+    caller_phone_hash: Optional[str]
+    created_us: int  # epoch microseconds, see app.utils.clock.epoch_us
+    processed_us: int  # MISSING_TIMESTAMP when not processed
+    escalation_active: bool  # triggered and not yet acknowledged
+    escalated_us: int  # see escalated_epoch_us; MISSING_TIMESTAMP when inactive
+    transcript_text: str
+    phone_text: str
+    symptom_text: str
+    medication_text: str
+    doctor_text: str
+
+    @classmethod
+    def from_voicemail(cls, voicemail: TriagedVoicemail) -> "VoicemailRow":
+        created_us = epoch_us(voicemail.created_at)
+        entities = voicemail.extracted_entities
+        escalation = voicemail.escalation
+        escalation_active = bool(
+            escalation and escalation.escalation_triggered and not voicemail.escalation_acknowledged
+        )
+        phones = [voicemail.caller_phone_redacted]
+        if entities:
+            phones.append(entities.callback_number)
+        return cls(
+            voicemail_id=voicemail.voicemail_id,
+            status=voicemail.status,
+            callback_status=voicemail.callback_status,
+            urgency_level=int(voicemail.urgency.level),
+            confidence=voicemail.urgency.confidence,
+            intent=voicemail.intent.value,
+            is_ambiguous=(
+                voicemail.intent is IntentType.AMBIGUOUS or
+                bool(voicemail.ui_state and voicemail.ui_state.is_ambiguous)
+            ),
+            language=voicemail.language,
+            assigned_to=voicemail.assigned_to,
+            caller_phone_hash=voicemail.caller_phone_hash,
+            created_us=created_us,
+            processed_us=epoch_us(voicemail.processed_at),
+            escalation_active=escalation_active,
+            escalated_us=escalated_epoch_us(escalation.timestamp_escalated) if escalation_active else MISSING_TIMESTAMP,
+            transcript_text=(voicemail.redacted_transcript or "").lower(),
+            phone_text=_search_text(phones).replace(" ", ""),
+            symptom_text=_search_text(entities.symptoms) if entities else "",
+            medication_text=_search_text(entities.medication_names) if entities else "",
+            doctor_text=_search_text([entities.mentioned_doctor]) if entities else ""
+        )
+
+
+class StoreListener:
+    """
+    Base class for views kept in sync with the voicemail store
+
+    `on_upsert` is called with the new row for new voicemails and again
+    after a stored voicemail has been modified, so listeners must be able
+    to replace whatever they previously derived for the same voicemail_id.
+    """
+
+    def on_upsert(self, row: VoicemailRow) -> None:
+        pass
+
+    def on_remove(self, row: VoicemailRow) -> None:
+        pass
+
+
+class AgedStatusIndex(StoreListener):
+    """
+    IDs of voicemails in one status that were created over `max_age_us` ago
+
+    Candidates wait in a heap ordered by creation time; `advance(now_us)`
+    moves those past the cutoff into `aged`, so each voicemail is checked
+    against the clock once rather than on every read. Status or creation
+    time changes reset a voicemail's entry; heap entries left behind by
+    such changes are skipped when popped.
+    """
+
+    def __init__(self, status: str, max_age_us: int):
+        self.status = status
+        self.max_age_us = max_age_us
+        self.aged: Set[str] = set()
+        self._created: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def _forget(self, voicemail_id: str) -> None:
+        self.aged.discard(voicemail_id)
+        self._created.pop(voicemail_id, None)
+
+    def on_upsert(self, row: VoicemailRow) -> None:
+        voicemail_id = row.voicemail_id
+        if row.status != self.status:
+            self._forget(voicemail_id)
+            return
+        if self._created.get(voicemail_id) == row.created_us:
+            return
+        self.aged.discard(voicemail_id)
+        self._created[voicemail_id] = row.created_us
+        heapq.heappush(self._heap, (row.created_us, voicemail_id))
+
+    def on_remove(self, row: VoicemailRow) -> None:
+        self._forget(row.voicemail_id)
+
+    def advance(self, now_us: int) -> Set[str]:
+        """Age out candidates created before now_us - max_age_us; returns `aged`"""
+        cutoff_us = now_us - self.max_age_us
+        heap = self._heap
+        while heap and heap[0][0] < cutoff_us:
+            created_us, voicemail_id = heapq.heappop(heap)
+            if self._created.get(voicemail_id) == created_us:
+                self.aged.add(voicemail_id)
+        return self.aged
+
+
+class TextScanIndex(StoreListener):
+    """
+    Substring search over chosen row text fields, one flat string scan
+
+    Each voicemail's fields are joined into one text ending in
+    SEARCH_SEPARATOR. On the first search after a write, the texts are
+    concatenated into a single buffer with the start offset of each, so a
+    search is a run of C-level `str.find` calls over the buffer. After each
+    hit the scan resumes at the next voicemail's text.
+
+    The needle is matched against the joined fields, so any field can
+    contain it. `matching` returns None for needles that contain the
+    separator, as they could match across field boundaries; callers then
+    fall back to checking the fields separately.
+    """
+
+    def __init__(self, *fields: str):
+        self.fields = fields
+        self._texts: Dict[str, str] = {}
+        self._buffer = ""
+        self._ids: List[str] = []
+        self._starts: List[int] = [0]
+        self._stale = False
+
+    def on_upsert(self, row: VoicemailRow) -> None:
+        text = SEARCH_SEPARATOR.join(getattr(row, field) for field in self.fields) + SEARCH_SEPARATOR
+        if self._texts.get(row.voicemail_id) != text:
+            self._texts[row.voicemail_id] = text
+            self._stale = True
+
+    def on_remove(self, row: VoicemailRow) -> None:
+        if self._texts.pop(row.voicemail_id, None) is not None:
+            self._stale = True
+
+    def _rebuild(self) -> None:
+        texts = self._texts
+        self._buffer = "".join(texts.values())
+        self._ids = list(texts)
+        self._starts = [0, *accumulate(map(len, texts.values()))]
+        self._stale = False
+
+    def matching(self, needle: str) -> Optional[Set[str]]:
+        """IDs whose joined fields contain `needle` (None if undecidable)"""
+        if SEARCH_SEPARATOR in needle:
+            return None
+        if self._stale:
+            self._rebuild()
+        buffer, ids, starts = self._buffer, self._ids, self._starts
+        matches: Set[str] = set()
+        position = buffer.find(needle)
+        while position != -1:
+            slot = bisect_right(starts, position) - 1
+            matches.add(ids[slot])
+            position = buffer.find(needle, starts[slot + 1])
+        return matches
+
+
+class SortedRowIndex(StoreListener):
+    """
+    IDs of the rows passing `include`, kept sorted by `key`
+
+    Entries are (key, sequence, voicemail_id) in a list maintained with
+    bisect, so reading the order is a plain walk and a change moves one
+    entry. The sequence number is assigned when a voicemail is first seen,
+    which makes ties fall back to store order as they would in a stable
+    sort of the store.
+    """
+
+    def __init__(self, include: Callable[[VoicemailRow], bool], key: Callable[[VoicemailRow], Any]):
+        self._include = include
+        self._key = key
+        self._entries: List[Tuple[Any, int, str]] = []
+        self._current: Dict[str, Tuple[Any, int, str]] = {}
+        self._sequence: Dict[str, int] = {}
+        self._next_sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _discard(self, entry: Tuple[Any, int, str]) -> None:
+        del self._entries[bisect_left(self._entries, entry)]
+
+    def on_upsert(self, row: VoicemailRow) -> None:
+        voicemail_id = row.voicemail_id
+        sequence = self._sequence.get(voicemail_id)
+        if sequence is None:
+            sequence = self._sequence[voicemail_id] = self._next_sequence
+            self._next_sequence += 1
+        entry = (self._key(row), sequence, voicemail_id) if self._include(row) else None
+        previous = self._current.get(voicemail_id)
+        if previous == entry:
+            return
+        if previous is not None:
+            self._discard(previous)
+            del self._current[voicemail_id]
+        if entry is not None:
+            insort(self._entries, entry)
+            self._current[voicemail_id] = entry
+
+    def on_remove(self, row: VoicemailRow) -> None:
+        self._sequence.pop(row.voicemail_id, None)
+        previous = self._current.pop(row.voicemail_id, None)
+        if previous is not None:
+            self._discard(previous)
+
+    def ids(self) -> List[str]:
+        """Matching voicemail IDs in sorted order"""
+        return [voicemail_id for _, _, voicemail_id in self._entries]
+
+
+class VoicemailStore:
+    """
+    In-memory voicemail store (replace with database in production)
+
+    Reads behave like a plain dict. Writes go through `upsert` / `remove`
+    so the secondary indexes and registered listeners see every change.
+    A voicemail modified in place only needs re-upserting when a field
+    copied into its VoicemailRow changed.
+
+    Indexes map a key to the set of matching voicemail IDs; keys with no
+    voicemails are dropped. Voicemails without a caller phone hash are not
+    in `by_phone_hash`.
+
+    `active_escalations` holds the IDs of voicemails whose escalation was
+    triggered and not yet acknowledged.
+
+    `rows` holds the VoicemailRow for each stored voicemail.
+
+    Iteration order is insertion order, as for a dict: updating a voicemail
+    keeps its position, removing and re-adding it moves it to the end.
+
+    `version` increases on every write so readers can cheaply tell whether
+    anything changed since they last looked.
+    """
+
+    def __init__(self):
+        self._voicemails: Dict[str, TriagedVoicemail] = {}
+        self._listeners: List[StoreListener] = []
+        self.version = 0
+        self.rows: Dict[str, VoicemailRow] = {}
+        self._order: Dict[str, int] = {}
+        self._next_order = 0
+        self.by_status: Dict[str, Set[str]] = {}
+        self.by_intent: Dict[str, Set[str]] = {}
+        self.by_urgency: Dict[int, Set[str]] = {}
+        self.by_phone_hash: Dict[str, Set[str]] = {}
+        self.active_escalations: Set[str] = set()
+
+    # ========================================================================
+    # LISTENERS
+    # ========================================================================
+
+    def subscribe(self, listener: StoreListener) -> None:
+        """Register a listener and replay the current contents into it"""
+        self._listeners.append(listener)
+        for row in self.rows.values():
+            listener.on_upsert(row)
+
+    # ========================================================================
+    # INDEXES
+    # ========================================================================
+
+    def _unindex(self, row: VoicemailRow) -> None:
+        voicemail_id = row.voicemail_id
+        _index_discard(self.by_status, row.status, voicemail_id)
+        _index_discard(self.by_intent, row.intent, voicemail_id)
+        _index_discard(self.by_urgency, row.urgency_level, voicemail_id)
+        if row.caller_phone_hash:
+            _index_discard(self.by_phone_hash, row.caller_phone_hash, voicemail_id)
+        self.active_escalations.discard(voicemail_id)
+
+    def _index(self, row: VoicemailRow) -> None:
+        voicemail_id = row.voicemail_id
+        _index_add(self.by_status, row.status, voicemail_id)
+        _index_add(self.by_intent, row.intent, voicemail_id)
+        _index_add(self.by_urgency, row.urgency_level, voicemail_id)
+        if row.caller_phone_hash:
+            _index_add(self.by_phone_hash, row.caller_phone_hash, voicemail_id)
+        if row.escalation_active:
+            self.active_escalations.add(voicemail_id)
+
+    # ========================================================================
+    # WRITES
+    # ========================================================================
+
+    def upsert(self, voicemail: TriagedVoicemail) -> None:
+        """Insert a voicemail, or re-index one that was modified in place"""
+        voicemail_id = voicemail.voicemail_id
+        row = VoicemailRow.from_voicemail(voicemail)
+        self._voicemails[voicemail_id] = voicemail
+        previous = self.rows.get(voicemail_id)
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._order[voicemail_id] = self._next_order
+            self._next_order += 1
+        self.rows[voicemail_id] = row
+        self._index(row)
+        self.version += 1
+        for listener in self._listeners:
+            listener.on_upsert(row)
+
+    def remove(self, voicemail_id: str) -> TriagedVoicemail:
+        """Remove a voicemail by ID (raises KeyError if missing)"""
+        voicemail = self._voicemails.pop(voicemail_id)
+        row = self.rows.pop(voicemail_id)
+        del self._order[voicemail_id]
+        self._unindex(row)
+        self.version += 1
+        for listener in self._listeners:
+            listener.on_remove(row)
+        return voicemail
+
+    def __setitem__(self, voicemail_id: str, voicemail: TriagedVoicemail) -> None:
+        if voicemail_id != voicemail.voicemail_id:
+            raise KeyError(f"Key {voicemail_id} does not match voicemail_id {voicemail.voicemail_id}")
+        self.upsert(voicemail)
+
+    def __delitem__(self, voicemail_id: str) -> None:
+        self.remove(voicemail_id)
+
+    # ========================================================================
+    # READS
+    # ========================================================================
+
+    def __getitem__(self, voicemail_id: str) -> TriagedVoicemail:
+        return self._voicemails[voicemail_id]
+
+    def __contains__(self, voicemail_id: object) -> bool:
+        return voicemail_id in self._voicemails
+
+    def __len__(self) -> int:
+        return len(self._voicemails)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._voicemails)
+
+    def get(self, voicemail_id: str, default: Optional[TriagedVoicemail] = None) -> Optional[TriagedVoicemail]:
+        return self._voicemails.get(voicemail_id, default)
+
+    def keys(self) -> KeysView[str]:
+        return self._voicemails.keys()
+
+    def values(self) -> ValuesView[TriagedVoicemail]:
+        return self._voicemails.values()
+
+    def items(self) -> ItemsView[str, TriagedVoicemail]:
+        return self._voicemails.items()
+
+    def select(
+        self,
+        status: Optional[str] = None,
+        intent: Optional[str] = None,
+        urgency_min: Optional[int] = None,
+        urgency_max: Optional[int] = None,
+        phone_hash: Optional[str] = None
+    ) -> Collection[VoicemailRow]:
+        """
+        Rows of voicemails matching every given criterion, in store order
+
+        Criteria left as None are not applied. Matching IDs come from
+        intersecting the index sets, smallest first; with no criteria the
+        live rows view is returned without copying.
+        """
+        if (status is None and intent is None and urgency_min is None and
+                urgency_max is None and phone_hash is None):
+            return self.rows.values()
+
+        candidates: List[Set[str]] = []
+        if status is not None:
+            candidates.append(self.by_status.get(status, set()))
+        if intent is not None:
+            candidates.append(self.by_intent.get(intent, set()))
+        if urgency_min is not None or urgency_max is not None:
+            in_range: Set[str] = set()
+            for level, ids in self.by_urgency.items():
+                if urgency_min is not None and level < urgency_min:
+                    continue
+                if urgency_max is not None and level > urgency_max:
+                    continue
+                in_range |= ids
+            candidates.append(in_range)
+        if phone_hash is not None:
+            candidates.append(self.by_phone_hash.get(phone_hash, set()))
+
+        candidates.sort(key=len)
+        return self.in_store_order(set(candidates[0]).intersection(*candidates[1:]))
+
+    def in_store_order(self, voicemail_ids: Iterable[str]) -> List[VoicemailRow]:
+        """Rows for the given stored IDs, in store order"""
+        rows = self.rows
+        return [rows[voicemail_id] for voicemail_id in sorted(voicemail_ids, key=self._order.__getitem__)]
+
+    def position(self, voicemail_id: str) -> int:
+        """Sort key that puts stored IDs in store order"""
+        return self._order[voicemail_id]
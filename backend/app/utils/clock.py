@@ -0,0 +1,81 @@
+"""
+Heidi Calls: Cached Clock
+Wall-clock values refreshed once per second for hot request paths
+
+Health probes and the analytics summary only need second-level accuracy,
+so a background ticker (started from the app lifespan) keeps the current
+ISO timestamp and UTC date in module globals. Until the ticker runs, e.g.
+when the app is imported without its lifespan, values are computed on
+each call.
+
+Also home to the epoch-microsecond conversion used wherever timestamps are
+stored or compared as plain ints.
+"""
+
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Optional
+
+TICK_SECONDS = 1.0
+
+HOUR_US = 3600 * 1_000_000
+DAY_US = 24 * HOUR_US
+
+# epoch_us() value for a missing datetime; sorts before every real time
+MISSING_TIMESTAMP = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+_ticking = False
+_now_iso = ""
+_today = date.min
+
+
+def _refresh() -> None:
+    global _now_iso, _today
+    now = datetime.utcnow()
+    _now_iso = now.isoformat()
+    _today = now.date()
+
+
+def epoch_us(moment: Optional[datetime]) -> int:
+    """Microseconds since the epoch; naive datetimes are taken as UTC"""
+    if moment is None:
+        return MISSING_TIMESTAMP
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return (moment - _EPOCH) // _ONE_MICROSECOND
+
+
+def now_us() -> int:
+    """Current time as epoch microseconds (epoch_us of utcnow(), uncached)"""
+    return time.time_ns() // 1000
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO 8601 string (naive, as utcnow())"""
+    if not _ticking:
+        return datetime.utcnow().isoformat()
+    return _now_iso
+
+
+def today() -> date:
+    """Current UTC date"""
+    if not _ticking:
+        return datetime.utcnow().date()
+    return _today
+
+
+async def run_ticker() -> None:
+    """Refresh the cached values every TICK_SECONDS until cancelled"""
+    global _ticking
+    _refresh()
+    _ticking = True
+    try:
+        while True:
+            await asyncio.sleep(TICK_SECONDS)
+            _refresh()
+    finally:
+        _ticking = False
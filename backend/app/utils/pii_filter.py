@@ -15,7 +15,8 @@ Detects and redacts:
 """
 
 import re
-from typing import Dict, List, Tuple, Optional
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
@@ -34,7 +35,37 @@ class PIIType(str, Enum):
     SSN = "social_security"  # For US compatibility
 
 
-@dataclass
+# str.translate table deleting ASCII non-digits; see strip_non_digits
+_ASCII_NON_DIGITS = {code: None for code in range(128) if not 48 <= code <= 57}
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+
+
+def strip_non_digits(value: str) -> str:
+    """
+    Remove every character that is not a decimal digit (as re.sub(r'\D', ...))
+
+    Non-ASCII leftovers, possibly Unicode digits that \d also matches, fall
+    back to the regex; the usual ASCII input is one str.translate call.
+    """
+    digits = value.translate(_ASCII_NON_DIGITS)
+    if not digits.isascii():
+        digits = _NON_DIGIT_PATTERN.sub('', value)
+    return digits
+
+
+# redact() memoizes results for this many distinct texts shorter than
+# REDACT_CACHE_MAX_LENGTH characters (replays, retries, repeated demo data)
+REDACT_CACHE_SIZE = 512
+REDACT_CACHE_MAX_LENGTH = 8192
+
+# Replacement text for redacted dates of birth and names
+_DOB_REDACTED = '[DOB REDACTED]'
+_NAME_REDACTED = '[NAME REDACTED]'
+# Substitution keeping a matched DOB prefix (group 1)
+_DOB_KEEP_PREFIX = r'\1' + _DOB_REDACTED
+
+
+@dataclass(slots=True)
 class PIIMatch:
     """Represents a detected PII instance"""
     pii_type: PIIType
@@ -53,6 +84,8 @@ class PIIRedactionFilter:
     def __init__(self, redaction_char: str = "█"):
         self.redaction_char = redaction_char
         self._compile_patterns()
+        self._build_scanners()
+        self._redact_cached = lru_cache(maxsize=REDACT_CACHE_SIZE)(self._redact)
     
     def _compile_patterns(self):
         """Pre-compile regex patterns for performance"""
@@ -93,6 +126,17 @@ class PIIRedactionFilter:
             re.compile(r'\b(\d{4}-\d{2}-\d{2})\b'),  # ISO format
         ]
         
+        # DOB prefixes kept by _redact_dob, in priority order, each as
+        # (prefix pattern, prefix-and-rest-of-line pattern)
+        self.dob_prefix_patterns = [
+            (re.compile(prefix, re.IGNORECASE), re.compile(prefix + r'.*', re.IGNORECASE))
+            for prefix in (
+                r'(date\s+of\s+birth\s*(?:is\s*)?)',
+                r'(DOB\s*:?\s*)',
+                r'(born\s+on\s*)',
+            )
+        ]
+        
         # Credit Card Numbers (13-19 digits, possibly with spaces/dashes)
         self.credit_card_pattern = re.compile(
             r'\b(?:\d{4}[-\s]?){3,4}\d{1,4}\b'
@@ -111,103 +155,110 @@ class PIIRedactionFilter:
             re.IGNORECASE
         )
         
+        # Any character \d matches; every numeric pattern (Medicare, phone,
+        # DOB, credit card, address) needs at least one
+        self.digit_pattern = re.compile(r'\d')
+        
         # Name patterns (following "my name is", "this is", "I'm", etc.)
+        # Group 1 captures the introduction or title kept in the redacted
+        # text; "speaking is" / "patient name:" are redacted with the name
         self.name_patterns = [
             re.compile(
-                r'(?:my\s+name\s+is|this\s+is|I\'?m|I\s+am|'
-                r'name\'?s|speaking\s+is|patient\s+name:?)\s+'
+                r'(?:((?:my\s+name\s+is|this\s+is|I\'?m|I\s+am|name\'?s)\s+)|'
+                r'(?:speaking\s+is|patient\s+name:?)\s+)'
                 r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){1,3})',
                 re.IGNORECASE
             ),
             # "Mrs/Mr/Ms/Dr Name"
             re.compile(
-                r'\b(?:Mrs?\.?|Ms\.?|Dr\.?|Miss)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\b'
+                r'\b((?:Mrs?\.?|Ms\.?|Dr\.?|Miss)\s+)([A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2})\b'
             ),
         ]
     
-    def detect_pii(self, text: str) -> List[PIIMatch]:
+    def _build_scanners(self):
         """
-        Detect all PII instances in the text.
-        Returns a list of PIIMatch objects with positions and types.
+        Build one closure per pattern that appends its PIIMatch objects to a
+        list, with the pattern, PII type and redaction bound at init time.
+
+        Scanners are (PII type, scanner) pairs kept in the order detect_pii
+        has always scanned, so ties in deduplication resolve as before.
+        _digitless_scanners are the ones that can match text without digits.
         """
-        matches: List[PIIMatch] = []
+        def scanner(pii_type: PIIType, pattern: re.Pattern, redact: Callable[[str], str]):
+            finditer = pattern.finditer
+            def scan(text: str, out: List[PIIMatch]) -> None:
+                for match in finditer(text):
+                    value = match.group()
+                    out.append(PIIMatch(pii_type, value, match.start(), match.end(), redact(value)))
+            return scan
         
-        # Medicare numbers
-        for match in self.medicare_pattern.finditer(text):
-            matches.append(PIIMatch(
-                pii_type=PIIType.MEDICARE,
-                original_value=match.group(),
-                start_pos=match.start(),
-                end_pos=match.end(),
-                redacted_value=self._redact_medicare(match.group())
-            ))
+        def email_scanner(text: str, out: List[PIIMatch]) -> None:
+            # Text without '@' cannot contain an address
+            if '@' in text:
+                scan_email(text, out)
         
-        # Phone numbers
-        for match in self.phone_pattern.finditer(text):
-            matches.append(PIIMatch(
-                pii_type=PIIType.PHONE,
-                original_value=match.group(),
-                start_pos=match.start(),
-                end_pos=match.end(),
-                redacted_value=self._redact_phone(match.group())
-            ))
+        def credit_card_scanner(text: str, out: List[PIIMatch]) -> None:
+            # Validate it looks like a credit card (not a phone or other number)
+            for match in find_credit_cards(text):
+                value = match.group()
+                digits_only = strip_non_digits(value)
+                if 13 <= len(digits_only) <= 19:
+                    out.append(PIIMatch(
+                        PIIType.CREDIT_CARD, value, match.start(), match.end(),
+                        self._redact_credit_card(digits_only)
+                    ))
         
-        # Emails
-        for match in self.email_pattern.finditer(text):
-            matches.append(PIIMatch(
-                pii_type=PIIType.EMAIL,
-                original_value=match.group(),
-                start_pos=match.start(),
-                end_pos=match.end(),
-                redacted_value=self._redact_email(match.group())
-            ))
+        def name_scanner(pattern: re.Pattern):
+            finditer = pattern.finditer
+            def scan(text: str, out: List[PIIMatch]) -> None:
+                for match in finditer(text):
+                    out.append(PIIMatch(
+                        PIIType.NAME, match.group(), match.start(), match.end(),
+                        self._redact_name(match.group(1))
+                    ))
+            return scan
         
-        # Dates of birth
-        for pattern in self.dob_patterns:
-            for match in pattern.finditer(text):
-                # Get the date part (group 1 if exists, otherwise full match)
-                date_value = match.group(1) if match.lastindex else match.group()
-                matches.append(PIIMatch(
-                    pii_type=PIIType.DOB,
-                    original_value=match.group(),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    redacted_value=self._redact_dob(match.group())
-                ))
+        scan_email = scanner(PIIType.EMAIL, self.email_pattern, self._redact_email)
+        find_credit_cards = self.credit_card_pattern.finditer
         
-        # Credit cards
-        for match in self.credit_card_pattern.finditer(text):
-            # Validate it looks like a credit card (not a phone or other number)
-            digits_only = re.sub(r'\D', '', match.group())
-            if 13 <= len(digits_only) <= 19:
-                matches.append(PIIMatch(
-                    pii_type=PIIType.CREDIT_CARD,
-                    original_value=match.group(),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    redacted_value=self._redact_credit_card(match.group())
-                ))
+        # Dates of birth. Only the contextual pattern ("DOB: ...") has a
+        # prefix to keep; standalone dates are replaced outright
+        contextual_dob, *standalone_dobs = self.dob_patterns
         
-        # Addresses
-        for match in self.address_pattern.finditer(text):
-            matches.append(PIIMatch(
-                pii_type=PIIType.ADDRESS,
-                original_value=match.group(),
-                start_pos=match.start(),
-                end_pos=match.end(),
-                redacted_value=self._redact_generic(match.group(), keep_last=0)
-            ))
+        self._scanners: Tuple[Tuple[PIIType, Callable[[str, List[PIIMatch]], None]], ...] = (
+            (PIIType.MEDICARE, scanner(PIIType.MEDICARE, self.medicare_pattern, self._redact_medicare)),
+            (PIIType.PHONE, scanner(PIIType.PHONE, self.phone_pattern, self._redact_phone)),
+            (PIIType.EMAIL, email_scanner),
+            (PIIType.DOB, scanner(PIIType.DOB, contextual_dob, self._redact_dob)),
+            *((PIIType.DOB, scanner(PIIType.DOB, pattern, lambda value: _DOB_REDACTED))
+              for pattern in standalone_dobs),
+            (PIIType.CREDIT_CARD, credit_card_scanner),
+            (PIIType.ADDRESS, scanner(PIIType.ADDRESS, self.address_pattern, self._redact_generic)),
+            *((PIIType.NAME, name_scanner(pattern)) for pattern in self.name_patterns),
+        )
+        self._digitless_scanners = tuple(
+            entry for entry in self._scanners if entry[0] in (PIIType.EMAIL, PIIType.NAME)
+        )
+    
+    def detect_pii(self, text: str, categories: Optional[FrozenSet[PIIType]] = None) -> List[PIIMatch]:
+        """
+        Detect all PII instances in the text.
+        Returns a list of PIIMatch objects with positions and types.
         
-        # Names
-        for pattern in self.name_patterns:
-            for match in pattern.finditer(text):
-                matches.append(PIIMatch(
-                    pii_type=PIIType.NAME,
-                    original_value=match.group(),
-                    start_pos=match.start(),
-                    end_pos=match.end(),
-                    redacted_value=self._redact_name(match.group())
-                ))
+        categories limits detection to those PII types (default: all).
+        """
+        matches: List[PIIMatch] = []
+        
+        # Prefilter: text without digits cannot match the numeric patterns
+        # (Medicare, phone, DOB, credit card, address)
+        if self.digit_pattern.search(text) is not None:
+            scanners = self._scanners
+        else:
+            scanners = self._digitless_scanners
+        
+        for pii_type, scan in scanners:
+            if categories is None or pii_type in categories:
+                scan(text, matches)
         
         # Remove duplicates and overlapping matches (keep longest)
         matches = self._deduplicate_matches(matches)
@@ -234,12 +285,12 @@ class PIIRedactionFilter:
     
     def _redact_medicare(self, value: str) -> str:
         """Redact Medicare number, keeping first 2 digits"""
-        digits = re.sub(r'\D', '', value)
+        digits = strip_non_digits(value)
         return digits[:2] + self.redaction_char * (len(digits) - 2)
     
     def _redact_phone(self, value: str) -> str:
         """Redact phone number, keeping last 3 digits"""
-        digits = re.sub(r'\D', '', value)
+        digits = strip_non_digits(value)
         return self.redaction_char * (len(digits) - 3) + digits[-3:]
     
     def _redact_email(self, value: str) -> str:
@@ -252,38 +303,20 @@ class PIIRedactionFilter:
     def _redact_dob(self, value: str) -> str:
         """Redact date of birth completely"""
         # Keep the prefix like "date of birth is" but redact the date
-        patterns = [
-            (r'(date\s+of\s+birth\s*(?:is\s*)?)', r'\1[DOB REDACTED]'),
-            (r'(DOB\s*:?\s*)', r'\1[DOB REDACTED]'),
-            (r'(born\s+on\s*)', r'\1[DOB REDACTED]'),
-        ]
-        result = value
-        for pattern, replacement in patterns:
-            if re.match(pattern, result, re.IGNORECASE):
-                return re.sub(pattern + r'.*', replacement, result, flags=re.IGNORECASE)
-        return '[DOB REDACTED]'
+        for prefix_pattern, redact_pattern in self.dob_prefix_patterns:
+            if prefix_pattern.match(value):
+                return redact_pattern.sub(_DOB_KEEP_PREFIX, value)
+        return _DOB_REDACTED
     
-    def _redact_credit_card(self, value: str) -> str:
-        """Redact credit card, keeping last 4 digits"""
-        digits = re.sub(r'\D', '', value)
+    def _redact_credit_card(self, digits: str) -> str:
+        """Redact credit card (given as its digits), keeping last 4 digits"""
         return self.redaction_char * (len(digits) - 4) + digits[-4:]
     
-    def _redact_name(self, value: str) -> str:
-        """Redact name while keeping the prefix"""
-        # Find common prefixes and keep them
-        prefixes = [
-            r'my\s+name\s+is\s+',
-            r'this\s+is\s+',
-            r'I\'?m\s+',
-            r'I\s+am\s+',
-            r'name\'?s\s+',
-            r'(?:Mrs?\.?|Ms\.?|Dr\.?|Miss)\s+'
-        ]
-        for prefix_pattern in prefixes:
-            match = re.match(f'({prefix_pattern})(.*)', value, re.IGNORECASE)
-            if match:
-                return match.group(1) + '[NAME REDACTED]'
-        return '[NAME REDACTED]'
+    def _redact_name(self, prefix: Optional[str]) -> str:
+        """Redact name while keeping the prefix captured by the name pattern"""
+        if prefix:
+            return prefix + _NAME_REDACTED
+        return _NAME_REDACTED
     
     def _redact_generic(self, value: str, keep_last: int = 0) -> str:
         """Generic redaction with optional last characters kept"""
@@ -291,26 +324,41 @@ class PIIRedactionFilter:
             return self.redaction_char * (len(value) - keep_last) + value[-keep_last:]
         return self.redaction_char * len(value)
     
-    def redact(self, text: str) -> Tuple[str, List[PIIMatch], bool]:
+    def redact(
+        self, text: str, categories: Optional[FrozenSet[PIIType]] = None
+    ) -> Tuple[str, List[PIIMatch], bool]:
         """
         Main redaction method.
+        categories limits redaction to those PII types (default: all).
         Returns: (redacted_text, list of matches, is_pii_safe)
         """
-        matches = self.detect_pii(text)
+        if len(text) < REDACT_CACHE_MAX_LENGTH:
+            redacted_text, matches, is_safe = self._redact_cached(text, categories)
+        else:
+            redacted_text, matches, is_safe = self._redact(text, categories)
+        # Cached matches are shared; each caller gets its own list
+        return redacted_text, list(matches), is_safe
+    
+    def _redact(
+        self, text: str, categories: Optional[FrozenSet[PIIType]]
+    ) -> Tuple[str, Tuple[PIIMatch, ...], bool]:
+        """Uncached redact(), with the matches as a tuple"""
+        matches = self.detect_pii(text, categories)
         
         if not matches:
-            return text, [], True
+            return text, (), True
         
-        # Apply redactions from end to start to preserve positions
-        redacted_text = text
-        for match in sorted(matches, key=lambda m: m.start_pos, reverse=True):
-            redacted_text = (
-                redacted_text[:match.start_pos] + 
-                match.redacted_value + 
-                redacted_text[match.end_pos:]
-            )
+        # Matches come back non-overlapping and in text order, so the output
+        # is the text between matches interleaved with the redactions
+        parts = []
+        last_end = 0
+        for match in matches:
+            parts.append(text[last_end:match.start_pos])
+            parts.append(match.redacted_value)
+            last_end = match.end_pos
+        parts.append(text[last_end:])
         
-        return redacted_text, matches, True
+        return "".join(parts), tuple(matches), True
     
     def get_pii_summary(self, matches: List[PIIMatch]) -> Dict[str, int]:
         """Get a summary count of PII types found"""
@@ -343,7 +391,7 @@ if __name__ == "__main__":
     My email is john.smith@email.com and I live at 42 Collins Street Melbourne.
     """
     
-    filter_instance = PIIRedactionFilter()
+    filter_instance = pii_filter
     redacted, matches, is_safe = filter_instance.redact(test_text)
     
     print("=== Original Text ===")
@@ -0,0 +1,43 @@
+"""
+Heidi Calls: JSON Responses
+Serialize Pydantic models and plain payloads straight to JSON bytes
+
+Returning a model from a route makes FastAPI re-validate it against the
+response_model and walk it again while encoding. Models here are already
+validated, so routes hand them to `model_response` instead and let
+pydantic-core write the JSON in one pass. Keep `response_model=` on the
+route decorator for the OpenAPI schema.
+
+`json_response` does the same for dicts/lists built by hand, skipping
+FastAPI's jsonable_encoder pass. `raw_json_response` wraps bytes that were
+rendered earlier and cached.
+"""
+
+from typing import Any
+
+import pydantic_core
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Render an already-validated model as a JSON response"""
+    return Response(
+        content=model.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
+def raw_json_response(body: bytes, status_code: int = 200) -> Response:
+    """Wrap pre-rendered JSON bytes in a response"""
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def json_response(content: Any, status_code: int = 200) -> Response:
+    """Render a JSON-compatible payload (dicts, lists, models, datetimes)"""
+    return Response(
+        content=pydantic_core.to_json(content),
+        status_code=status_code,
+        media_type="application/json"
+    )
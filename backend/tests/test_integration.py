@@ -4,7 +4,7 @@ Tests core functionality including multilingual triage, entity extraction, and e
 
 Usage:
     cd backend
-    pip install pytest httpx
+    pip install pytest pytest-asyncio httpx
     pytest tests/test_integration.py -v
 
 Or run directly:
@@ -13,6 +13,7 @@ Or run directly:
 
 import sys
 import json
+import asyncio
 from datetime import datetime
 
 # For running without pytest
@@ -22,16 +23,41 @@ except ImportError:
     print("Please install httpx: pip install httpx")
     sys.exit(1)
 
+try:
+    import pytest
+    import pytest_asyncio
+except ImportError:
+    pytest = None  # Only needed under pytest; run_all_tests drives the event loop itself
+
 BASE_URL = "http://127.0.0.1:8000/api/v1"
 
 
+def _client() -> httpx.AsyncClient:
+    """Client shared by the whole suite, so requests reuse pooled keep-alive connections"""
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=8)
+    )
+
+
+if pytest is not None:
+    # One event loop for the module, so the shared client's connections stay usable
+    pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def client():
+        async with _client() as shared:
+            yield shared
+
+
 class TestHeidiCallsIntegration:
     """Integration tests for Heidi Calls API"""
 
     # ========================================================================
     # TEST 1: Vietnamese Emergency Voicemail
     # ========================================================================
-    def test_vietnamese_emergency_triage(self):
+    async def test_vietnamese_emergency_triage(self, client):
         """
         Test Case: Vietnamese patient with emergency symptoms
 
@@ -52,8 +78,7 @@ class TestHeidiCallsIntegration:
             "duration_seconds": 45
         }
 
-        with httpx.Client(timeout=30.0) as client:
-            response = client.post(f"{BASE_URL}/voicemail/triage", json=payload)
+        response = await client.post("/voicemail/triage", json=payload)
 
         assert response.status_code == 200, f"Expected 200, got {response.status_code}: {response.text}"
 
@@ -82,10 +107,9 @@ class TestHeidiCallsIntegration:
     # ========================================================================
     # TEST 2: API Connectivity - List Voicemails
     # ========================================================================
-    def test_list_voicemails(self):
+    async def test_list_voicemails(self, client):
         """Test that voicemail list endpoint returns data"""
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{BASE_URL}/voicemail/", params={"page_size": 10})
+        response = await client.get("/voicemail/", params={"page_size": 10})
 
         assert response.status_code == 200, f"Expected 200, got {response.status_code}"
 
@@ -114,11 +138,10 @@ class TestHeidiCallsIntegration:
     # ========================================================================
     # TEST 3: Status Update (PATCH)
     # ========================================================================
-    def test_status_update(self):
+    async def test_status_update(self, client):
         """Test that status can be updated via PATCH"""
         # First, get a voicemail ID
-        with httpx.Client(timeout=30.0) as client:
-            list_response = client.get(f"{BASE_URL}/voicemail/", params={"page_size": 1})
+        list_response = await client.get("/voicemail/", params={"page_size": 1})
 
         assert list_response.status_code == 200
         items = list_response.json().get("items", [])
@@ -130,11 +153,10 @@ class TestHeidiCallsIntegration:
         # Update status
         new_status = "actioned" if original_status != "actioned" else "pending"
 
-        with httpx.Client(timeout=30.0) as client:
-            patch_response = client.patch(
-                f"{BASE_URL}/voicemail/{voicemail_id}",
-                json={"status": new_status}
-            )
+        patch_response = await client.patch(
+            f"/voicemail/{voicemail_id}",
+            json={"status": new_status}
+        )
 
         print("\n" + "=" * 60)
         print("TEST 3: Status Update (PATCH)")
@@ -149,18 +171,16 @@ class TestHeidiCallsIntegration:
         print(f"[OK] Status changed: {original_status} → {new_status}")
 
         # Restore original status
-        with httpx.Client(timeout=30.0) as client:
-            client.patch(f"{BASE_URL}/voicemail/{voicemail_id}", json={"status": original_status})
+        await client.patch(f"/voicemail/{voicemail_id}", json={"status": original_status})
 
         return result
 
     # ========================================================================
     # TEST 4: Entity Extraction Verification
     # ========================================================================
-    def test_entity_extraction_in_demo_data(self):
+    async def test_entity_extraction_in_demo_data(self, client):
         """Verify demo data contains properly extracted entities"""
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{BASE_URL}/voicemail/", params={"page_size": 100})
+        response = await client.get("/voicemail/", params={"page_size": 100})
 
         assert response.status_code == 200
         items = response.json().get("items", [])
@@ -210,13 +230,12 @@ class TestHeidiCallsIntegration:
     # ========================================================================
     # TEST 5: Emergency Escalation Data
     # ========================================================================
-    def test_emergency_escalation_data(self):
+    async def test_emergency_escalation_data(self, client):
         """Verify Level 5 cases have escalation info"""
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(
-                f"{BASE_URL}/voicemail/",
-                params={"urgency_min": 5, "page_size": 100}
-            )
+        response = await client.get(
+            "/voicemail/",
+            params={"urgency_min": 5, "page_size": 100}
+        )
 
         assert response.status_code == 200
         items = response.json().get("items", [])
@@ -265,10 +284,9 @@ class TestHeidiCallsIntegration:
     # ========================================================================
     # TEST 6: Smart Routing / Location Assignment
     # ========================================================================
-    def test_smart_routing(self):
+    async def test_smart_routing(self, client):
         """Verify location routing is present in demo data"""
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(f"{BASE_URL}/voicemail/", params={"page_size": 100})
+        response = await client.get("/voicemail/", params={"page_size": 100})
 
         assert response.status_code == 200
         items = response.json().get("items", [])
@@ -308,24 +326,37 @@ def run_all_tests():
 
     test_suite = TestHeidiCallsIntegration()
 
-    tests = [
-        ("List Voicemails", test_suite.test_list_voicemails),
+    # Status Update mutates a voicemail, so it runs on its own before the
+    # read-only tests, which are independent and run concurrently
+    serial_tests = [
         ("Status Update", test_suite.test_status_update),
+    ]
+    concurrent_tests = [
+        ("List Voicemails", test_suite.test_list_voicemails),
         ("Entity Extraction", test_suite.test_entity_extraction_in_demo_data),
         ("Emergency Escalation", test_suite.test_emergency_escalation_data),
         ("Smart Routing", test_suite.test_smart_routing),
         ("Vietnamese Emergency", test_suite.test_vietnamese_emergency_triage),
     ]
 
-    results = []
-    for name, test_func in tests:
+    async def run_test(name, test_func, client):
         try:
-            test_func()
-            results.append((name, "PASS", None))
+            await test_func(client)
+            return (name, "PASS", None)
         except AssertionError as e:
-            results.append((name, "FAIL", str(e)))
+            return (name, "FAIL", str(e))
         except Exception as e:
-            results.append((name, "ERROR", str(e)))
+            return (name, "ERROR", str(e))
+
+    async def run_tests():
+        async with _client() as client:
+            results = [await run_test(name, test_func, client) for name, test_func in serial_tests]
+            results += await asyncio.gather(
+                *(run_test(name, test_func, client) for name, test_func in concurrent_tests)
+            )
+        return results
+
+    results = asyncio.run(run_tests())
 
     # Summary
     print("\n" + "=" * 60)